@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Type, TypeVar, Any, Tuple
 
-from discord import User
+from discord import Embed, User
 
 from Classes.Common import Identifiable, LazyUser
 
@@ -90,7 +90,13 @@ class ActivityEntry(Identifiable, ABC):
     
 ################################################################################
     @abstractmethod
-    async def notify(self) -> bool:
+    def win_embed(self) -> Embed:
+        
+        raise NotImplementedError
+    
+################################################################################
+    @abstractmethod
+    async def log_notified(self) -> None:
         
         raise NotImplementedError
     
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import csv
+import io
+import json
 import random
 from abc import ABC
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
 
-from discord import Interaction, SelectOption
+from discord import File, Interaction, SelectOption, User
 from discord.ext.pages import Page
 
 from Classes.Common import ManagedObject
 from Errors import NoEntries
 from UI.Common import ConfirmCancelView
-from Utilities import Utilities as U
+from Utilities import Utilities as U, Attachments
+from Utilities.Constants import ENTRIES_REPORT_BATCH_SIZE
 from .ActivityDetails import ActivityDetails
 from .ActivityEntry import ActivityEntry
 
@@ -29,6 +35,8 @@ class BaseActivity(ManagedObject, ABC):
         "_winners",
         "_event",
     )
+
+    REPORT_FORMATS = ("txt", "csv", "jsonl")
     
 ################################################################################
     def __init__(
@@ -160,12 +168,36 @@ class BaseActivity(ManagedObject, ABC):
             if not view.complete or view.value is False:
                 return
         
-        self.winners = random.sample(self._entries, max(self.num_winners, len(self._entries)))
+        self.winners = self._draw_winners()
         
         if self._details.auto_notify:
-            for winner in self.winners:
-                await winner.notify()
+            await self.notify_winners()
     
+################################################################################
+    async def notify_winners(self) -> None:
+
+        users = await asyncio.gather(*(w.user for w in self._winners), return_exceptions=True)
+        # Winners whose user can't be fetched count as undelivered.
+        users = [None if isinstance(u, Exception) else u for u in users]
+        messages = [
+            (user, {"embed": winner.win_embed()})
+            for winner, user in zip(self._winners, users)
+            if user is not None
+        ]
+        report = await self.bot.notifier.send_many(
+            self.guild, messages, unresolved=len(users) - len(messages)
+        )
+
+        delivered = {u.id for u in report.delivered}
+        for winner, user in zip(self._winners, users):
+            if user is not None and user.id in delivered:
+                await winner.log_notified()
+
+################################################################################
+    def _draw_winners(self) -> List[ActivityEntry]:
+
+        return random.sample(self._entries, min(self.num_winners, len(self._entries)))
+
 ################################################################################
     def select_option(self) -> SelectOption:
         
@@ -206,25 +238,72 @@ class BaseActivity(ManagedObject, ABC):
         raise NotImplementedError
     
 ################################################################################
-    async def generate_entries_report_str(self, final: bool = False) -> str:
+    async def _iter_report_rows(
+        self, final: bool
+    ) -> AsyncIterator[Tuple[ActivityEntry, Optional[User], bool]]:
+
+        winner_ids = {w.id for w in self._winners} if final else set()
+
+        # Users are resolved a batch at a time rather than one await per entry.
+        for i in range(0, len(self._entries), ENTRIES_REPORT_BATCH_SIZE):
+            batch = self._entries[i:i + ENTRIES_REPORT_BATCH_SIZE]
+            users = await asyncio.gather(*(e.user for e in batch), return_exceptions=True)
+            for entry, user in zip(batch, users):
+                if isinstance(user, Exception):
+                    user = None
+                yield entry, user, entry.id in winner_ids
+
+################################################################################
+    async def export_entries(
+        self,
+        fmt: str = "txt",
+        final: bool = False,
+        footer: Optional[str] = None
+    ) -> File:
+
+        if fmt not in self.REPORT_FORMATS:
+            raise ValueError(f"Unsupported entries report format: {fmt}")
+
+        buffer = io.BytesIO()
+        text = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+
+        if fmt == "txt":
+            text.write(f"{self.activity_name} Entry Data for {self.name}:\n\n")
+        elif fmt == "csv":
+            writer = csv.writer(text)
+            writer.writerow(["user_id", "display_name", "entries", "winner"])
 
-        entry_data = (
-            f"{self.activity_name} Entry Data for {self.name}:\n\n"
+        async for entry, user, is_winner in self._iter_report_rows(final):
+            user_id = user.id if user is not None else entry._user.id
+            display_name = user.display_name if user is not None else "Unknown User"
+            match fmt:
+                case "txt":
+                    text.write(
+                        f"{'**' if is_winner else ''}{display_name} - "
+                        f"{entry.quantity}x entries - ({user_id})"
+                        f"{' - WINNER' if is_winner else ''}\n"
+                    )
+                case "csv":
+                    writer.writerow([user_id, display_name, entry.quantity, is_winner])
+                case "jsonl":
+                    text.write(json.dumps({
+                        "user_id": user_id,
+                        "display_name": display_name,
+                        "entries": entry.quantity,
+                        "winner": is_winner,
+                    }) + "\n")
+
+        if footer and fmt == "txt":
+            text.write(f"\n\n{footer}")
+
+        text.flush()
+        text.detach()
+
+        filename = (
+            f"{self.name or f'Unnamed {self.activity_name}'} Entries - "
+            f"{datetime.now().strftime('%m-%d-%y')}.{fmt}"
         )
-        # self.entries.sort(key=lambda x: x.user.display_name)
-        for entry in self.entries:
-            user = await entry.user
-            if final and entry in self.winners:
-                entry_data += "**"
-            entry_data += (
-                f"{user.display_name} - {entry.quantity}x entries - ({user.id})"
-            )
-            if final and entry in self.winners:
-                entry_data += " - WINNER\n"
-            else:
-                entry_data += "\n"
-            
-        return entry_data
+        return Attachments.from_buffer(buffer, filename)
     
 ################################################################################
     
\ No newline at end of file
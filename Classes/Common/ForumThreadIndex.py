@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+from discord import ForumChannel, HTTPException, Message, NotFound, Thread
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("ForumThreadIndex", )
+
+################################################################################
+class ForumThreadIndex:
+    """Per-channel lookup of forum threads by (case-insensitive) name."""
+
+    __slots__ = (
+        "_state",
+        "_index",
+    )
+
+################################################################################
+    def __init__(self, state: GuildData) -> None:
+
+        self._state: GuildData = state
+        self._index: Dict[int, Dict[str, int]] = {}
+
+################################################################################
+    @property
+    def guild(self) -> GuildData:
+
+        return self._state
+
+################################################################################
+    def _channel_index(self, channel: ForumChannel) -> Dict[str, int]:
+
+        index = self._index.get(channel.id)
+        if index is None:
+            index = self._index[channel.id] = {t.name.lower(): t.id for t in channel.threads}
+            log.debug(self.guild, f"Indexed {len(index)} thread(s) in forum {channel.name}.")
+
+        return index
+
+################################################################################
+    async def get(self, channel: ForumChannel, name: str) -> Optional[Thread]:
+
+        index = self._channel_index(channel)
+        thread_id = index.get(name.lower())
+        if thread_id is None:
+            return
+
+        # Archived threads drop out of the cache, so fall back to a fetch.
+        thread = channel.get_thread(thread_id)
+        if thread is None:
+            thread = await self.guild.get_or_fetch_channel(thread_id)
+
+        if not isinstance(thread, Thread):
+            index.pop(name.lower(), None)
+            return
+
+        return thread
+
+################################################################################
+    def register(self, thread: Thread) -> None:
+
+        # Channels that haven't been indexed yet will pick this up when they are.
+        if (index := self._index.get(thread.parent_id)) is not None:
+            index[thread.name.lower()] = thread.id
+
+################################################################################
+    def unregister(self, thread: Thread) -> None:
+
+        index = self._index.get(thread.parent_id)
+        if index is None:
+            return
+
+        name = thread.name.lower()
+        if index.get(name) == thread.id:
+            del index[name]
+
+################################################################################
+    def unregister_id(self, parent_id: int, thread_id: int) -> None:
+
+        # Raw deletes carry no name, so match on the thread ID instead.
+        index = self._index.get(parent_id)
+        if index is None:
+            return
+
+        for name, indexed_id in index.items():
+            if indexed_id == thread_id:
+                del index[name]
+                return
+
+################################################################################
+    def rename(self, before: Thread, after: Thread) -> None:
+
+        if before.name != after.name:
+            self.unregister(before)
+            self.register(after)
+
+################################################################################
+    @staticmethod
+    async def starter_message(thread: Thread) -> Optional[Message]:
+
+        # A forum post's starter message shares its ID with the thread.
+        if thread.starting_message is not None:
+            return thread.starting_message
+
+        try:
+            return await thread.fetch_message(thread.id)
+        except (NotFound, HTTPException):
+            return
+
+################################################################################
+    async def own_starter_message(self, thread: Thread) -> Optional[Message]:
+
+        starter = await self.starter_message(thread)
+        if starter is None or starter.author.id != self.guild.bot.user.id:
+            return
+
+        return starter
+
+################################################################################
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from .RefreshDebouncer import RefreshDebouncer
+################################################################################
+
+__all__ = ("PostRefresher", )
+
+################################################################################
+class PostRefresher:
+
+    # Users declare `_refresher` in their own slots.
+    __slots__ = ()
+
+################################################################################
+    def _init_refresher(self, delay: float, min_interval: float = 0.0) -> None:
+
+        # Bursts of changes are coalesced into as few post edits as possible.
+        self._refresher: RefreshDebouncer = RefreshDebouncer(
+            self.update_post_components,  # type: ignore
+            delay,
+            min_interval
+        )
+
+################################################################################
+    def request_post_refresh(self) -> None:
+
+        self._refresher.request()
+
+################################################################################
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from logger import log
+################################################################################
+
+__all__ = ("RefreshDebouncer", )
+
+################################################################################
+class RefreshDebouncer:
+    """Coalesces bursts of refresh requests into a single callback."""
+
+    __slots__ = (
+        "_callback",
+        "_delay",
+        "_min_interval",
+        "_last_run",
+        "_pending",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        callback: Callable[[], Awaitable[Any]],
+        delay: float,
+        min_interval: float = 0.0
+    ) -> None:
+
+        self._callback: Callable[[], Awaitable[Any]] = callback
+        self._delay: float = delay
+        self._min_interval: float = min_interval
+
+        self._last_run: Optional[float] = None
+        self._pending: Optional[asyncio.Task] = None
+
+################################################################################
+    @property
+    def is_pending(self) -> bool:
+
+        return self._pending is not None and not self._pending.done()
+
+################################################################################
+    def request(self) -> None:
+
+        if self.is_pending:
+            return
+
+        wait = self._delay
+        if self._last_run is not None:
+            next_allowed = self._last_run + self._min_interval
+            wait = max(wait, next_allowed - asyncio.get_running_loop().time())
+
+        self._pending = asyncio.create_task(self._run_after(wait))
+
+################################################################################
+    async def flush(self) -> None:
+
+        self.cancel()
+        await self._invoke()
+
+################################################################################
+    def cancel(self) -> None:
+
+        if self.is_pending:
+            self._pending.cancel()
+        self._pending = None
+
+################################################################################
+    async def _run_after(self, delay: float) -> None:
+
+        await asyncio.sleep(delay)
+        # Clear first so requests made during the callback open a new window.
+        self._pending = None
+        await self._invoke()
+
+################################################################################
+    async def _invoke(self) -> None:
+
+        self._last_run = asyncio.get_running_loop().time()
+        try:
+            await self._callback()
+        except Exception as ex:
+            log.error(None, f"Debounced refresh failed: {ex!r}")
+
+################################################################################
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from discord import Member, Role
+################################################################################
+
+__all__ = ("RoleUpdate", "RoleSyncReport")
+
+################################################################################
+class RoleSyncReport:
+
+    __slots__ = (
+        "checked",
+        "updated",
+        "added",
+        "removed",
+        "failed",
+        "missing",
+        "skipped",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self.checked: int = 0
+        self.updated: int = 0
+        self.added: int = 0
+        self.removed: int = 0
+        self.failed: List[Member] = []
+        self.missing: List[int] = []
+        self.skipped: List[int] = []
+
+################################################################################
+    def summary(self) -> str:
+
+        return (
+            f"{self.checked} checked, {self.updated} updated "
+            f"(+{self.added}/-{self.removed} roles), {len(self.failed)} failed, "
+            f"{len(self.missing)} not in server, {len(self.skipped)} skipped"
+        )
+
+################################################################################
+class RoleUpdate:
+    """Plans role changes for a member in memory and applies them in one call."""
+
+    __slots__ = (
+        "_member",
+        "_roles",
+    )
+
+################################################################################
+    def __init__(self, member: Member) -> None:
+
+        self._member: Member = member
+
+        # Keyed by ID to keep the member's existing order stable.
+        self._roles: Dict[int, Role] = {r.id: r for r in member.roles if not r.is_default()}
+
+################################################################################
+    def __contains__(self, role: Optional[Role]) -> bool:
+
+        return role is not None and role.id in self._roles
+
+################################################################################
+    @property
+    def member(self) -> Member:
+
+        return self._member
+
+################################################################################
+    @property
+    def roles(self) -> List[Role]:
+
+        return list(self._roles.values())
+
+################################################################################
+    @property
+    def added(self) -> List[Role]:
+
+        current = {r.id for r in self._member.roles}
+        return [r for r in self._roles.values() if r.id not in current]
+
+################################################################################
+    @property
+    def removed(self) -> List[Role]:
+
+        return [r for r in self._member.roles if not r.is_default() and r.id not in self._roles]
+
+################################################################################
+    @property
+    def changed(self) -> bool:
+
+        return bool(self.added or self.removed)
+
+################################################################################
+    def add(self, *roles: Optional[Role]) -> RoleUpdate:
+
+        for role in roles:
+            if role is not None:
+                self._roles[role.id] = role
+
+        return self
+
+################################################################################
+    def remove(self, *roles: Optional[Role]) -> RoleUpdate:
+
+        for role in roles:
+            if role is not None:
+                self._roles.pop(role.id, None)
+
+        return self
+
+################################################################################
+    async def apply(self, reason: Optional[str] = None) -> bool:
+
+        if not self.changed:
+            return False
+
+        await self._member.edit(roles=self.roles, reason=reason)
+        return True
+
+################################################################################
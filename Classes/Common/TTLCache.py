@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+from logger import log
+from .RefreshDebouncer import RefreshDebouncer
+################################################################################
+
+__all__ = ("TTLCache", )
+
+V = TypeVar("V")
+
+################################################################################
+class TTLCache(Generic[V]):
+    """Size-bounded key/value cache whose entries expire after `ttl` seconds."""
+
+    __slots__ = (
+        "_ttl",
+        "_maxsize",
+        "_path",
+        "_data",
+        "_saver",
+    )
+
+    SAVE_DELAY_SECONDS = 30
+
+################################################################################
+    def __init__(self, ttl: float, maxsize: int, path: Optional[str] = None) -> None:
+
+        self._ttl: float = ttl
+        self._maxsize: int = maxsize
+        self._path: Optional[str] = path
+
+        # key -> (expires_at, value), oldest first
+        self._data: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+        self._saver: Optional[RefreshDebouncer] = (
+            RefreshDebouncer(self.save, self.SAVE_DELAY_SECONDS) if path else None
+        )
+
+        if path:
+            self._load()
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._data)
+
+################################################################################
+    def get(self, key: Hashable) -> Optional[V]:
+
+        item = self._data.get(key)
+        if item is None:
+            return
+
+        expires_at, value = item
+        if expires_at <= time.time():
+            del self._data[key]
+            return
+
+        self._data.move_to_end(key)
+        return value
+
+################################################################################
+    def set(self, key: Hashable, value: V) -> None:
+
+        self._data[key] = (time.time() + self._ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+        if self._saver is not None:
+            self._saver.request()
+
+################################################################################
+    def invalidate(self, key: Hashable) -> None:
+
+        self._data.pop(key, None)
+
+################################################################################
+    @staticmethod
+    def _encode_key(key: Hashable) -> Any:
+
+        return list(key) if isinstance(key, tuple) else key
+
+################################################################################
+    @staticmethod
+    def _decode_key(key: Any) -> Hashable:
+
+        return tuple(key) if isinstance(key, list) else key
+
+################################################################################
+    def _load(self) -> None:
+
+        if not os.path.exists(self._path):
+            return
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                records = json.load(file)
+        except (OSError, ValueError) as e:
+            log.error(None, f"Error reading cache file {self._path}: {e.args}")
+            return
+
+        now = time.time()
+        for key, expires_at, value in records:
+            if expires_at > now:
+                self._data[self._decode_key(key)] = (expires_at, value)
+
+################################################################################
+    async def save(self) -> None:
+
+        if not self._path:
+            return
+
+        now = time.time()
+        records = [
+            [self._encode_key(key), expires_at, value]
+            for key, (expires_at, value) in self._data.items()
+            if expires_at > now
+        ]
+
+        def _write() -> None:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            with open(self._path, "w", encoding="utf-8") as file:
+                json.dump(records, file)
+
+        try:
+            await asyncio.to_thread(_write)
+        except OSError as e:
+            log.error(None, f"Error writing cache file {self._path}: {e.args}")
+
+################################################################################
@@ -1,6 +1,11 @@
 from .FroggeObject import FroggeObject
+from .ForumThreadIndex import ForumThreadIndex
 from .Identifiable import Identifiable
 from .LazyLoadable import *
 from .ManagedObject import ManagedObject
 from .ObjectManager import ObjectManager
+from .PostRefresher import PostRefresher
+from .RefreshDebouncer import RefreshDebouncer
+from .RoleUpdate import RoleUpdate, RoleSyncReport
+from .TTLCache import TTLCache
 ################################################################################
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
 from datetime import datetime
-from typing import Any, Optional, TypeVar, Dict, Union, TYPE_CHECKING, List
+from typing import Any, Optional, TypeVar, Dict, Union, TYPE_CHECKING, List, Tuple
 from urllib.parse import quote as _uriquote
 
 from dotenv import load_dotenv
 from requests import Session
 
+from Utilities.Constants import MAX_CONCURRENT_API_REQUESTS
+
 if TYPE_CHECKING:
     from Classes import *
 ################################################################################
@@ -52,11 +56,25 @@ class APIClient:
 
         self._client: FroggeBot = client
 
-        self.session: Session = Session()
+        # requests.Session isn't thread-safe, and batches run in worker
+        # threads, so each thread gets its own.
+        self._local: threading.local = threading.local()
         self.token: Optional[str] = None
 
+        self._batch_limit: asyncio.Semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_REQUESTS)
+
 ################################################################################
 # Primary Methods            
+################################################################################
+    @property
+    def session(self) -> Session:
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = Session()
+
+        return session
+
 ################################################################################
     def request(self, route: Route, _fmt: str = "json", **kwargs: Any) -> Union[Dict[str, Any], str]:
 
@@ -85,6 +103,24 @@ class APIClient:
                 else response.text
             )
 
+################################################################################
+    async def request_many(
+        self, calls: List[Tuple[Route, Dict[str, Any]]]
+    ) -> List[Union[Dict[str, Any], str, Exception]]:
+
+        # Runs a batch of blocking requests off the event loop so the caller
+        # awaits a single operation, capped to stay friendly with the API.
+        # Results line up with `calls`; a failed call yields its exception
+        # so callers can apply only the ones that went through.
+        async def _request(route: Route, params: Dict[str, Any]) -> Union[Dict[str, Any], str]:
+            async with self._batch_limit:
+                return await asyncio.to_thread(self.request, route, **params)
+
+        return await asyncio.gather(
+            *[_request(route, params) for route, params in calls],
+            return_exceptions=True
+        )
+
 ################################################################################
     def login(self):
 
@@ -924,6 +960,29 @@ class APIClient:
             id=signup_id
         )
 
+################################################################################
+    async def create_event_signups(self, position_id: int, staff_id: int, bracket_ids: List[int]):
+
+        return await self.request_many([
+            (
+                Route("POST", "/events/signups"),
+                {
+                    "position_id": position_id,
+                    "staff_id": staff_id,
+                    "bracket_id": bracket_id
+                }
+            )
+            for bracket_id in bracket_ids
+        ])
+
+################################################################################
+    async def delete_event_signups(self, signup_ids: List[int]):
+
+        return await self.request_many([
+            (Route("DELETE", "/events/signups"), {"id": signup_id})
+            for signup_id in signup_ids
+        ])
+
 ################################################################################
 # Giveaway Endpoints
 ################################################################################
@@ -963,6 +1022,22 @@ class APIClient:
             id=entry_id
         )
 
+################################################################################
+    async def create_giveaway_entries(self, giveaway_id: int, user_ids: List[int]):
+
+        return await self.request_many([
+            (Route("POST", "/giveaways/entries"), {"giveaway_id": giveaway_id, "user_id": user_id})
+            for user_id in user_ids
+        ])
+
+################################################################################
+    async def delete_giveaway_entries(self, entry_ids: List[int]):
+
+        return await self.request_many([
+            (Route("DELETE", "/giveaways/entries"), {"id": entry_id})
+            for entry_id in entry_ids
+        ])
+
 ################################################################################
     def update_giveaway(self, giveaway: Giveaway):
 
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 import traceback
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Optional
 import json
 
 import pytz
-from discord import Attachment, Bot, TextChannel, ApplicationContext, DiscordException, File, Interaction
+from discord import Attachment, Bot, TextChannel, ApplicationContext, DiscordException, Interaction
+from discord.abc import GuildChannel
 
 from Assets import BotImages
 from logger import log
 from .APIClient import APIClient
 from .GuildManager import GuildManager
 from .LodestoneClient import LodestoneClient
-from Utilities import Utilities as U
+from .TaskScheduler import TaskScheduler
+from .DMNotifier import DMNotifier
+from .WebhookDelivery import WebhookDelivery
+from .VerificationQueue import VerificationQueue
+from .VerifiedIdentityIndex import VerifiedIdentityIndex
+from .CaptchaPool import CaptchaPool
+from .RESTAudit import RESTAudit
+from Utilities import Utilities as U, Attachments
 
 if TYPE_CHECKING:
     from Classes import GuildData
@@ -29,9 +38,16 @@ class FroggeBot(Bot):
     __slots__ = (
         "_img_dump",
         "_error_dump",
+        "_shared_channels",
         "_guild_mgr",
         "_lodestone",
         "_api",
+        "_scheduler",
+        "_notifier",
+        "_webhooks",
+        "_verify_queue",
+        "_identities",
+        "_captchas",
     )
     
     IMAGE_DUMP = 991902526188302427
@@ -44,10 +60,17 @@ class FroggeBot(Bot):
 
         self._img_dump: TextChannel = None  # type: ignore
         self._error_dump: TextChannel = None  # type: ignore
+        self._shared_channels: Dict[int, GuildChannel] = {}
       
         self._guild_mgr: GuildManager = GuildManager(self)
         self._lodestone: LodestoneClient = LodestoneClient(self)
         self._api: APIClient = APIClient(self)
+        self._scheduler: TaskScheduler = TaskScheduler(self)
+        self._notifier: DMNotifier = DMNotifier(self)
+        self._webhooks: WebhookDelivery = WebhookDelivery(self)
+        self._verify_queue: VerificationQueue = VerificationQueue(self)
+        self._identities: VerifiedIdentityIndex = VerifiedIdentityIndex(self)
+        self._captchas: CaptchaPool = CaptchaPool(self)
         
 ################################################################################
     def __getitem__(self, guild_id: int) -> GuildData:
@@ -77,13 +100,81 @@ class FroggeBot(Bot):
         
         return self._api
     
+################################################################################
+    @property
+    def scheduler(self) -> TaskScheduler:
+        
+        return self._scheduler
+    
+################################################################################
+    @property
+    def notifier(self) -> DMNotifier:
+        
+        return self._notifier
+    
+################################################################################
+    @property
+    def webhooks(self) -> WebhookDelivery:
+        
+        return self._webhooks
+    
+################################################################################
+    @property
+    def verify_queue(self) -> VerificationQueue:
+        
+        return self._verify_queue
+    
+################################################################################
+    @property
+    def identities(self) -> VerifiedIdentityIndex:
+        
+        return self._identities
+    
+################################################################################
+    @property
+    def captchas(self) -> CaptchaPool:
+        
+        return self._captchas
+    
+################################################################################
+    async def shared_channel(self, channel_id: int) -> Optional[GuildChannel]:
+
+        if channel := self._shared_channels.get(channel_id):
+            return channel
+
+        channel = self.get_channel(channel_id) or await self.fetch_channel(channel_id)
+        self._shared_channels[channel_id] = channel
+        return channel
+
 ################################################################################
     async def load_all(self) -> None:
 
+        # Set AUDIT_STARTUP=True to log every REST call made while loading.
+        if os.getenv("AUDIT_STARTUP") != "True":
+            await self._load_all()
+            return
+
+        audit = RESTAudit(self.http)
+        audit.start()
+        try:
+            await self._load_all()
+        finally:
+            # Never leave the HTTP client patched, even if loading failed.
+            audit.stop()
+            audit.report("Startup audit")
+
+################################################################################
+    async def _load_all(self) -> None:
+
         log.info(None, "Initializing... Fetching dump channels...")
         # Dump channels can be hard-coded since they'll always be guaranteed.
-        self._img_dump = await self.fetch_channel(self.IMAGE_DUMP)
-        self._error_dump = await self.fetch_channel(self.ERROR_OUT)
+        self._img_dump, self._error_dump = await asyncio.gather(
+            self.shared_channel(self.IMAGE_DUMP),
+            self.shared_channel(self.ERROR_OUT)
+        )
+
+        # Warm the captcha pool in the background while guilds load.
+        self._captchas.fill()
 
         log.info(None, "Loading all Frogge Guilds...")
         
@@ -113,6 +204,12 @@ class FroggeBot(Bot):
 
         log.info(None, "Done!")
     
+################################################################################
+    async def close(self) -> None:
+
+        await self._lodestone.close()
+        await super().close()
+
 ################################################################################
     async def dump_image(self, image: Attachment) -> str:
         """Dumps an image into the image dump channel and returns the URL.
@@ -146,15 +243,10 @@ class FroggeBot(Bot):
         tb_list = traceback.format_exception(type(error), error, error.__traceback__)
 
         tz = pytz.timezone("America/Los_Angeles")
-        try:
-            directory = "ErrorLogs/"
-            fp = f"ErrorLogs/{tz.localize(datetime.now()).strftime('%m-%d-%y-%H-%M-%S')}-error.log"
-            os.makedirs(directory, exist_ok=True)
-            with open(fp, "w") as file:
-                file.write("".join(tb_list))
-                log.info(None, f"Error logged to {fp}")
-        except OSError as e:
-            log.error(None, f"Error logging to {fp}: {e.args}")
+        filename = f"{tz.localize(datetime.now()).strftime('%m-%d-%y-%H-%M-%S')}-error.log"
+        full_tb = "".join(tb_list)
+        if os.getenv("PERSIST_ERROR_LOGS") == "True":
+            await Attachments.persist(full_tb, f"ErrorLogs/{filename}")
 
         divider = "The above exception was the direct cause of the following exception:"
         divider_loc = None
@@ -173,7 +265,7 @@ class FroggeBot(Bot):
 
         await self._error_dump.send(
             f"# __Error in Command:__ `{ctx.command.name}`\n```{tb_str}```",
-            file=File(fp)
+            file=Attachments.from_text(full_tb, filename)
         )
 
 ################################################################################
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from captcha.image import ImageCaptcha
+
+from Utilities.Constants import CAPTCHA_POOL_SIZE
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import FroggeBot
+################################################################################
+
+__all__ = ("CaptchaPool", )
+
+# (code, PNG bytes)
+Captcha = Tuple[str, bytes]
+
+################################################################################
+class CaptchaPool:
+    """Keeps a handful of pre-rendered captcha images in memory."""
+
+    __slots__ = (
+        "_state",
+        "_generator",
+        "_pool",
+        "_refiller",
+    )
+
+################################################################################
+    def __init__(self, bot: FroggeBot) -> None:
+
+        self._state: FroggeBot = bot
+
+        self._generator: ImageCaptcha = ImageCaptcha()
+        self._pool: asyncio.Queue[Captcha] = asyncio.Queue(maxsize=CAPTCHA_POOL_SIZE)
+        self._refiller: Optional[asyncio.Task] = None
+
+################################################################################
+    def __len__(self) -> int:
+
+        return self._pool.qsize()
+
+################################################################################
+    def _render(self) -> Captcha:
+
+        code = str(random.randint(100000, 999999))
+        return code, self._generator.generate(code).getvalue()
+
+################################################################################
+    async def _refill(self) -> None:
+
+        try:
+            while not self._pool.full():
+                self._pool.put_nowait(await asyncio.to_thread(self._render))
+        except Exception as ex:
+            log.error(None, f"Captcha pool refill failed: {ex!r}")
+
+################################################################################
+    def fill(self) -> None:
+
+        if self._refiller is None or self._refiller.done():
+            self._refiller = asyncio.create_task(self._refill())
+
+################################################################################
+    async def take(self) -> Captcha:
+
+        try:
+            captcha = self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            captcha = await asyncio.to_thread(self._render)
+
+        self.fill()
+        return captcha
+
+################################################################################
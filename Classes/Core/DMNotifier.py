@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+
+from discord import Forbidden, HTTPException, Member, NotFound, User
+
+from Utilities.Constants import MAX_CONCURRENT_DMS, DM_MAX_ATTEMPTS, DM_RETRY_BASE_SECONDS
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import FroggeBot, GuildData
+################################################################################
+
+__all__ = ("DMNotifier", "DeliveryReport")
+
+Recipient = Union[User, Member]
+
+################################################################################
+class DeliveryReport:
+
+    __slots__ = (
+        "delivered",
+        "dms_closed",
+        "missing",
+        "failed",
+        "unresolved",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self.delivered: List[Recipient] = []
+        self.dms_closed: List[Recipient] = []
+        self.missing: List[Recipient] = []
+        self.failed: List[Recipient] = []
+        # Recipients whose user couldn't be resolved, so were never sent to.
+        self.unresolved: int = 0
+
+################################################################################
+    def __len__(self) -> int:
+
+        return (
+            len(self.delivered) + len(self.dms_closed) + len(self.missing)
+            + len(self.failed) + self.unresolved
+        )
+
+################################################################################
+    def summary(self) -> str:
+
+        return (
+            f"{len(self.delivered)} delivered, {len(self.dms_closed)} DMs closed, "
+            f"{len(self.missing)} missing, {len(self.failed)} failed, "
+            f"{self.unresolved} unresolved"
+        )
+
+################################################################################
+class DMNotifier:
+    """Bot-wide direct message delivery."""
+
+    __slots__ = (
+        "_state",
+        "_limit",
+    )
+
+################################################################################
+    def __init__(self, bot: FroggeBot) -> None:
+
+        self._state: FroggeBot = bot
+        self._limit: asyncio.Semaphore = asyncio.Semaphore(MAX_CONCURRENT_DMS)
+
+################################################################################
+    @property
+    def bot(self) -> FroggeBot:
+
+        return self._state
+
+################################################################################
+    async def send(self, guild: GuildData, user: Recipient, **kwargs) -> DeliveryReport:
+
+        return await self.send_many(guild, [(user, kwargs)])
+
+################################################################################
+    async def send_many(
+        self,
+        guild: GuildData,
+        messages: List[Tuple[Recipient, Dict[str, Any]]],
+        unresolved: int = 0
+    ) -> DeliveryReport:
+
+        report = DeliveryReport()
+        report.unresolved = unresolved
+        if not messages:
+            return report
+
+        await asyncio.gather(*[self._deliver(user, kwargs, report) for user, kwargs in messages])
+
+        if report.dms_closed:
+            await guild.log.dms_closed(*report.dms_closed)
+        if report.missing:
+            await guild.log.user_not_found(*report.missing)
+
+        log.info(guild, f"Bulk DM delivery: {report.summary()}.")
+        return report
+
+################################################################################
+    async def _deliver(self, user: Recipient, kwargs: Dict[str, Any], report: DeliveryReport) -> None:
+
+        attempt = 0
+        async with self._limit:
+            while attempt < DM_MAX_ATTEMPTS:
+                attempt += 1
+                try:
+                    await user.send(**kwargs)
+                except Forbidden:
+                    report.dms_closed.append(user)
+                    return
+                except NotFound:
+                    report.missing.append(user)
+                    return
+                except HTTPException as ex:
+                    # Only rate limits and server errors are worth another try.
+                    if ex.status != 429 and ex.status < 500:
+                        break
+                    retry_after = getattr(ex, "retry_after", None)
+                    # Holding the slot while we wait slows the whole pool down.
+                    await asyncio.sleep(retry_after or DM_RETRY_BASE_SECONDS * (2 ** (attempt - 1)))
+                else:
+                    report.delivered.append(user)
+                    return
+
+        log.warning(None, f"Failed to DM user {user.id} after {attempt} attempt(s).")
+        report.failed.append(user)
+
+################################################################################
@@ -86,6 +86,12 @@ class GuildConfiguration(FroggeObject):
         
         self._log_channel.set(value)
         
+################################################################################
+    @property
+    def log_channel_id(self) -> Optional[int]:
+        
+        return self._log_channel.id
+    
 ################################################################################
     def update(self) -> None:
         
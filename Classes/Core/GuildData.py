@@ -21,6 +21,7 @@ from Classes.Embeds.EmbedManager import EmbedManager
 from Classes.Finances.FinanceManager import FinanceManager
 from Classes.TimeClock.PunchManager import PunchManager
 from Classes.MessageBuilder.MessageBuilder import MessageBuilder
+from Classes.Common.ForumThreadIndex import ForumThreadIndex
 
 from logger import log
 
@@ -52,6 +53,7 @@ class GuildData:
         "_finance_mgr",
         "_punch_mgr",
         "_msg_builder",
+        "_thread_index",
     )
 
 ################################################################################
@@ -78,6 +80,8 @@ class GuildData:
         self._punch_mgr: PunchManager = PunchManager(self)
         self._msg_builder: MessageBuilder = MessageBuilder(self)
 
+        self._thread_index: ForumThreadIndex = ForumThreadIndex(self)
+
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
         
@@ -216,6 +220,12 @@ class GuildData:
 
         return self._msg_builder
 
+###############################################################################
+    @property
+    def thread_index(self) -> ForumThreadIndex:
+
+        return self._thread_index
+
 ###############################################################################
     async def get_or_fetch_channel(self, channel_id: Optional[int]) -> Optional[GuildChannel]:
         
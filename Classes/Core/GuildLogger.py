@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import os
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Dict, List
 
@@ -11,11 +11,14 @@ from discord import (
     Member,
     User,
     EmbedField,
-    File,
+    Forbidden,
+    NotFound,
 )
 
+from Classes.Common import RefreshDebouncer
 from Enums import LogType
 from Utilities import Utilities as U, FroggeColor
+from Utilities.Constants import LOG_FLUSH_SECONDS, LOG_EMBEDS_PER_MESSAGE, MAX_EMBED_LENGTH
 
 if TYPE_CHECKING:
     from Classes import *
@@ -28,6 +31,12 @@ class GuildLogger:
 
     __slots__ = (
         "_guild",
+        "_channel",
+        "_channel_id",
+        "_buffer",
+        "_buffer_len",
+        "_flusher",
+        "_lock",
     )
 
 ################################################################################
@@ -35,10 +44,25 @@ class GuildLogger:
 
         self._guild: GuildData = state
 
+        self._channel: Optional[TextChannel] = None
+        self._channel_id: Optional[int] = None
+
+        # Log embeds are packed into as few messages as possible.
+        self._buffer: List[Embed] = []
+        self._buffer_len: int = 0
+        self._flusher: RefreshDebouncer = RefreshDebouncer(self.flush, LOG_FLUSH_SECONDS)
+        self._lock: asyncio.Lock = asyncio.Lock()
+
 ################################################################################
     async def log_channel(self) -> Optional[TextChannel]:
 
-        return await self._guild.config.log_channel
+        # Only resolve again when the configured channel changes.
+        channel_id = self._guild.config.log_channel_id
+        if channel_id != self._channel_id:
+            self._channel_id = channel_id
+            self._channel = await self._guild.config.log_channel
+
+        return self._channel
 
 ################################################################################
     async def _log(self, message: Embed, action: LogType, **kwargs) -> None:
@@ -52,8 +76,49 @@ class GuildLogger:
             print(f"Invalid action passed to LOG_COLORS: '{action}'")
             message.colour = Colour.embed_background()
 
+        # Attachments can't be packed, but they still go out in order.
+        if kwargs:
+            await self.flush()
+            await self._send([message], **kwargs)
+            return
+
+        if (
+            len(self._buffer) >= LOG_EMBEDS_PER_MESSAGE
+            or self._buffer_len + len(message) > MAX_EMBED_LENGTH
+        ):
+            await self.flush()
+
+        self._buffer.append(message)
+        self._buffer_len += len(message)
+
+        if len(self._buffer) >= LOG_EMBEDS_PER_MESSAGE:
+            await self.flush()
+        else:
+            self._flusher.request()
+
+################################################################################
+    async def flush(self) -> None:
+
+        self._flusher.cancel()
+
+        async with self._lock:
+            embeds, self._buffer, self._buffer_len = self._buffer, [], 0
+            if embeds:
+                await self._send(embeds)
+
+################################################################################
+    async def _send(self, embeds: List[Embed], **kwargs) -> None:
+
         channel = await self.log_channel()
-        await channel.send(embed=message, **kwargs)
+        if channel is None:
+            return
+
+        try:
+            # Delivered via webhook when possible so logging has its own rate limit.
+            await self._guild.bot.webhooks.send(channel, embeds=embeds, **kwargs)
+        except (Forbidden, NotFound):
+            # Forget the channel so it's resolved again next time.
+            self._channel_id = None
        
 ################################################################################
     async def _member_event(self, member: Member, _type: LogType) -> None:
@@ -90,11 +155,19 @@ class GuildLogger:
         await self._log(embed, LogType.UserDeleted)
         
 ################################################################################
-    async def dms_closed(self, user: User) -> None:
+    async def dms_closed(self, *users: User) -> None:
         
+        if len(users) == 1:
+            description = f"{users[0].mention} ({users[0].name}) was unable to be DM'd by the bot!"
+        else:
+            description = (
+                f"**{len(users)}** users were unable to be DM'd by the bot:\n" +
+                "\n".join(f"* {u.mention} ({u.name})" for u in users)
+            )
+
         embed = U.make_embed(
             title="DMs Closed",
-            description=f"{user.mention} ({user.name}) was unable to be DM'd by the bot!",
+            description=description[:4000],
             timestamp=True
         )
         
@@ -106,10 +179,8 @@ class GuildLogger:
         for member in members:
             perks_summary = ""
             for p in member.tier.perks:
-                status = "Not Redeemed"
-                for override in member.overrides:
-                    if override.perk.id == p.id:
-                        status = override.level.proper_name
+                override = member.get_override(p.id)
+                status = override.level.proper_name if override else "Not Redeemed"
                 perks_summary += f"* `{p.text}` - `{status}`\n"
             if not perks_summary:
                 perks_summary = "`No Perks Defined in Previous Tier`"
@@ -149,14 +220,16 @@ class GuildLogger:
         await self._log(embed, LogType.VerificationSubmitted)
 
 ################################################################################
-    async def user_not_found(self, user: User) -> None:
+    async def user_not_found(self, *users: User) -> None:
 
         embed = U.make_embed(
             title="User Not Found",
             description=(
-                f"User {user.mention} ({user.display_name}) was not found by "
-                f"Discord! This user may have deleted their account."
-            ),
+                ", ".join(f"User {u.mention} ({u.display_name})" for u in users) +
+                f" {'was' if len(users) == 1 else 'were'} not found by Discord! "
+                f"{'This user' if len(users) == 1 else 'These users'} may have "
+                f"deleted their account."
+            )[:4000],
             timestamp=True
         )
 
@@ -197,23 +270,29 @@ class GuildLogger:
             timestamp=True
         )
 
-        entry_data = await activity.generate_entries_report_str(True)
-        entry_data += f"\n\nRolled at {datetime.now().strftime('%m-%d-%y %H:%M:%S')}"
+        footer = f"Rolled at {datetime.now().strftime('%m-%d-%y %H:%M:%S')}"
         if roller is not None:
-            entry_data += f" by {roller.display_name} ({roller.id})"
+            footer += f" by {roller.display_name} ({roller.id})"
         else:
-            entry_data += " by the auto-roll system"
+            footer += " by the auto-roll system"
 
-        filename = f"{activity.name}-{datetime.now().strftime('%m-%d-%y')}.txt"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(entry_data)
+        report = await activity.export_entries("txt", final=True, footer=footer)
+        await self._log(embed, LogType.ActivityRolled, file=report)
 
-        await self._log(embed, LogType.ActivityRolled, file=File(filename))
+################################################################################
+    async def activity_closed(self, activity: BaseActivity) -> None:
 
-        try:
-            os.remove(filename)
-        except FileNotFoundError:
-            pass
+        activity_name = activity.activity_name
+        embed = U.make_embed(
+            title=f"{activity_name} Closed",
+            description=(
+                f"{activity_name} `{activity.name}` ended with no entries, "
+                "so no winners were drawn."
+            ),
+            timestamp=True
+        )
+
+        await self._log(embed, LogType.ActivityClosed)
 
 ################################################################################
     async def raffle_winner_notified(self, winner: RaffleEntry) -> None:
@@ -248,5 +327,6 @@ LOG_COLORS: Dict[LogType, FroggeColor] = {
     LogType.UserNotFound: FroggeColor.royal_blue(),
     LogType.GiveawayWinnerNotified: FroggeColor.light_sea_green(),
     LogType.RaffleWinnerNotified: FroggeColor.steel_blue(),
+    LogType.ActivityClosed: FroggeColor.dim_grey(),
 }
 ################################################################################
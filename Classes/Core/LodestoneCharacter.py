@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+################################################################################
+
+__all__ = ("LodestoneCharacter", )
+
+################################################################################
+class LodestoneCharacter:
+    """Structured snapshot of a Lodestone character profile page."""
+
+    __slots__ = (
+        "_id",
+        "_name",
+        "_title",
+        "_world",
+        "_data_center",
+        "_bio",
+        "_portrait",
+        "_avatar",
+        "_fetched_at",
+    )
+
+    # Nodes kept by the parser; everything else on the page is skipped.
+    PROFILE_CLASSES = (
+        "frame__chara__name",
+        "frame__chara__title",
+        "frame__chara__world",
+        "frame__chara__face",
+        "character__selfintroduction",
+        "character__detail__image",
+    )
+    # <body> class of the missing-character page.
+    ERROR_CLASS = "error__body"
+
+################################################################################
+    def __init__(self, _id: int, **kwargs) -> None:
+
+        self._id: int = _id
+
+        self._name: Optional[str] = kwargs.get("name")
+        self._title: Optional[str] = kwargs.get("title")
+        self._world: Optional[str] = kwargs.get("world")
+        self._data_center: Optional[str] = kwargs.get("data_center")
+        self._bio: str = kwargs.get("bio") or ""
+        self._portrait: Optional[str] = kwargs.get("portrait_url")
+        self._avatar: Optional[str] = kwargs.get("avatar_url")
+        self._fetched_at: datetime = kwargs.get("fetched_at") or datetime.now(UTC)
+
+################################################################################
+    @classmethod
+    def from_html(cls, char_id: int, html: str, parser: str) -> Optional[LodestoneCharacter]:
+
+        # The error <body> only matches on the missing-character page, so a
+        # real profile still parses just the profile nodes.
+        strainer = SoupStrainer(class_=(*cls.PROFILE_CLASSES, cls.ERROR_CLASS))
+        soup = BeautifulSoup(html, parser, parse_only=strainer)
+        if soup.find("body", class_=cls.ERROR_CLASS):
+            return
+
+        def _text(class_: str) -> Optional[str]:
+            tag = soup.find(class_=class_)
+            return tag.get_text(strip=True) if tag else None
+
+        def _img(class_: str) -> Optional[str]:
+            tag = soup.find(class_=class_)
+            img = tag.find("img") if tag else None
+            return img.get("src") if img else None
+
+        world = data_center = None
+        if world_str := _text("frame__chara__world"):
+            # Formatted as "World [Data Center]"
+            world, _, data_center = world_str.partition("[")
+            world = world.strip() or None
+            data_center = data_center.rstrip("]").strip() or None
+
+        bio = soup.find(class_="character__selfintroduction")
+
+        return cls(
+            char_id,
+            name=_text("frame__chara__name"),
+            title=_text("frame__chara__title"),
+            world=world,
+            data_center=data_center,
+            bio=bio.get_text() if bio else "",
+            portrait_url=_img("character__detail__image"),
+            avatar_url=_img("frame__chara__face"),
+        )
+
+################################################################################
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> LodestoneCharacter:
+
+        return cls(
+            data["id"],
+            name=data.get("name"),
+            title=data.get("title"),
+            world=data.get("world"),
+            data_center=data.get("data_center"),
+            bio=data.get("bio"),
+            portrait_url=data.get("portrait_url"),
+            avatar_url=data.get("avatar_url"),
+            fetched_at=datetime.fromisoformat(data["fetched_at"]) if data.get("fetched_at") else None,
+        )
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "id": self._id,
+            "name": self._name,
+            "title": self._title,
+            "world": self._world,
+            "data_center": self._data_center,
+            "bio": self._bio,
+            "portrait_url": self._portrait,
+            "avatar_url": self._avatar,
+            "fetched_at": self._fetched_at.isoformat(),
+        }
+
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
+################################################################################
+    @property
+    def name(self) -> Optional[str]:
+
+        return self._name
+
+################################################################################
+    @property
+    def title(self) -> Optional[str]:
+
+        return self._title
+
+################################################################################
+    @property
+    def world(self) -> Optional[str]:
+
+        return self._world
+
+################################################################################
+    @property
+    def data_center(self) -> Optional[str]:
+
+        return self._data_center
+
+################################################################################
+    @property
+    def bio(self) -> str:
+
+        return self._bio
+
+################################################################################
+    @property
+    def portrait_url(self) -> Optional[str]:
+
+        return self._portrait
+
+################################################################################
+    @property
+    def avatar_url(self) -> Optional[str]:
+
+        return self._avatar
+
+################################################################################
+    @property
+    def fetched_at(self) -> datetime:
+
+        return self._fetched_at
+
+################################################################################
+    @property
+    def url(self) -> str:
+
+        return f"https://na.finalfantasyxiv.com/lodestone/character/{self._id}/"
+
+################################################################################
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import re
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import requests
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
 from bs4 import BeautifulSoup
 from discord import Interaction
 
 from Enums import GameWorld
 from Utilities import Utilities as U
+from Classes.Common import TTLCache
+from Utilities.Constants import (
+    LODESTONE_MAX_CONNECTIONS,
+    LODESTONE_TIMEOUT_SECONDS,
+    LODESTONE_SEARCH_TTL_SECONDS,
+    LODESTONE_PROFILE_TTL_SECONDS,
+    LODESTONE_CACHE_SIZE,
+    LODESTONE_CACHE_DIR,
+)
+from logger import log
+from .LodestoneCharacter import LodestoneCharacter
 
 if TYPE_CHECKING:
     from Classes import FroggeBot
@@ -16,20 +29,105 @@ if TYPE_CHECKING:
 
 __all__ = ("LodestoneClient",)
 
+# lxml is several times faster than the pure-Python parser, but optional.
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+CHARACTER_HREF = re.compile(r"^/lodestone/character/(\d+)/$")
+
 ################################################################################
 class LodestoneClient:
 
     __slots__ = (
         "_state",
+        "_session",
+        "_search_cache",
+        "_profile_cache",
     )
-    
+
     BASE_URL = "https://na.finalfantasyxiv.com/lodestone/character/"
-    
+
 ################################################################################
     def __init__(self, bot: FroggeBot) -> None:
 
         self._state: FroggeBot = bot
-    
+        self._session: Optional[ClientSession] = None
+
+        # Shared by every guild, so a lookup made in one is free in the rest.
+        self._search_cache: TTLCache[int] = TTLCache(
+            LODESTONE_SEARCH_TTL_SECONDS,
+            LODESTONE_CACHE_SIZE,
+            f"{LODESTONE_CACHE_DIR}search.json" if LODESTONE_CACHE_DIR else None
+        )
+        self._profile_cache: TTLCache[Dict[str, Any]] = TTLCache(
+            LODESTONE_PROFILE_TTL_SECONDS,
+            LODESTONE_CACHE_SIZE,
+            f"{LODESTONE_CACHE_DIR}profiles.json" if LODESTONE_CACHE_DIR else None
+        )
+
+################################################################################
+    @property
+    def session(self) -> ClientSession:
+
+        # Created lazily so it binds to the running event loop.
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=LODESTONE_MAX_CONNECTIONS),
+                timeout=ClientTimeout(total=LODESTONE_TIMEOUT_SECONDS)
+            )
+
+        return self._session
+
+################################################################################
+    async def close(self) -> None:
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        await self._search_cache.save()
+        await self._profile_cache.save()
+
+################################################################################
+    async def _get(self, interaction: Optional[Interaction], url: str, **params: str) -> Optional[str]:
+
+        try:
+            async with self.session.get(url, params=params or None) as response:
+                # A missing character is a 404 whose error page we still parse;
+                # any other error status means the Lodestone itself is unwell.
+                if response.status != 404:
+                    response.raise_for_status()
+                return await response.text()
+        except (ClientError, asyncio.TimeoutError) as ex:
+            log.warning(None, f"Lodestone request failed: {ex!r}")
+            error = U.make_error(
+                title="Lodestone Unavailable",
+                message="The Lodestone could not be reached at this time.",
+                solution="Please wait a few minutes and try again."
+            )
+            if interaction is not None:
+                await interaction.respond(embed=error, ephemeral=True)
+
+################################################################################
+    @staticmethod
+    def _parse_search(html: str, full_name: str) -> Tuple[bool, Optional[int]]:
+
+        soup = BeautifulSoup(html, HTML_PARSER)
+
+        # Check for <p> tag with class 'parts__zero'
+        if soup.find('p', class_='parts__zero'):
+            return False, None
+
+        # Find <a> tag with class 'entry__link' and href pattern, then match the
+        # name inside <p class="entry__name">
+        for link in soup.find_all('a', class_='entry__link', href=True):
+            if not (match := CHARACTER_HREF.match(link['href'])):
+                continue
+            parent_div = link.find_next('div', class_='entry__box--world')
+            name_tag = parent_div.find('p', class_='entry__name') if parent_div else None
+            if name_tag and name_tag.text.strip().lower() == full_name.lower():
+                return True, int(match.group(1))
+
+        return True, None
+
 ################################################################################
     async def fetch_character_id(
         self,
@@ -38,14 +136,26 @@ class LodestoneClient:
         surname: str,
         world: GameWorld
     ) -> Optional[int]:
-        
-        request_url = self.BASE_URL + f"?q={forename}+{surname}&worldname={world.proper_name}"
-        response = requests.get(request_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-    
-        # Check for <p> tag with class 'parts__zero'
-        no_results = soup.find('p', class_='parts__zero')
-        if no_results:
+
+        cache_key = (forename.lower(), surname.lower(), world.value)
+        if (char_id := self._search_cache.get(cache_key)) is not None:
+            return char_id
+
+        html = await self._get(
+            interaction, self.BASE_URL, q=f"{forename} {surname}", worldname=world.proper_name
+        )
+        if html is None:
+            return
+
+        # Parsing is CPU-bound, so keep it off the event loop.
+        any_results, char_id = await asyncio.to_thread(
+            self._parse_search, html, f"{forename} {surname}"
+        )
+        if char_id is not None:
+            self._search_cache.set(cache_key, char_id)
+            return char_id
+
+        if not any_results:
             error = U.make_error(
                 title="No Character Results Found",
                 message=(
@@ -57,68 +167,58 @@ class LodestoneClient:
                     "try again."
                 )
             )
-            await interaction.respond(embed=error, ephemeral=True)
-            return
-    
-        # Find <a> tag with class 'entry__link' and href pattern
-        entry_links = soup.find_all('a', class_='entry__link', href=True)
-        filtered_links = [
-            link
-            for link in entry_links 
-            if re.match(r"^/lodestone/character/\d+/$", link['href'])
-        ]
-
-        # Further filter by checking the name inside <p class="entry__name">
-        for link in filtered_links:
-            parent_div = link.find_next('div', class_='entry__box--world')
-            if parent_div:
-                name_tag = parent_div.find('p', class_='entry__name')
-                if name_tag and name_tag.text.strip().lower() == f"{forename} {surname}".lower():
-                    # Extract the character ID from the href
-                    return int(re.search(r"\d+", link['href']).group())
-
-        error = U.make_error(
-            title="Character Not Found with Exact Name",
-            message=(
-                f"No exact match found for '{forename} {surname}' on '{world.proper_name}'. "
-                "Try refining your search or checking the spelling."
-            ),
-            solution="Ensure the correct name and try again."
-        )
+        else:
+            error = U.make_error(
+                title="Character Not Found with Exact Name",
+                message=(
+                    f"No exact match found for '{forename} {surname}' on '{world.proper_name}'. "
+                    "Try refining your search or checking the spelling."
+                ),
+                solution="Ensure the correct name and try again."
+            )
         await interaction.respond(embed=error, ephemeral=True)
 
 ################################################################################
-    async def fetch_character_profile(self, interaction: Interaction, char_id: int) -> Optional[BeautifulSoup]:
-        
-        response = requests.get(self.BASE_URL + str(char_id) + "/")
-        soup = BeautifulSoup(response.text, "html.parser")
+    async def fetch_character(
+        self,
+        interaction: Optional[Interaction],
+        char_id: int,
+        fresh: bool = False
+    ) -> Optional[LodestoneCharacter]:
+
+        if not fresh and (data := self._profile_cache.get(int(char_id))) is not None:
+            return LodestoneCharacter.from_dict(data)
+
+        html = await self._get(interaction, self.BASE_URL + str(char_id) + "/")
+        if html is None:
+            return
 
-        if _ := soup.find_all('body', class_='error__body'):
+        character = await asyncio.to_thread(LodestoneCharacter.from_html, int(char_id), html, HTML_PARSER)
+        if character is None:
             error = U.make_error(
                 title="Character Profile Missing",
                 description=f"Invalid Character ID: {char_id}",
                 message="The character profile you are trying to access does not exist.",
                 solution="Please ensure the name and world are correct and try again."
             )
-            await interaction.respond(embed=error, ephemeral=True)
+            if interaction is not None:
+                await interaction.respond(embed=error, ephemeral=True)
             return
-        
-        return soup
-    
-################################################################################        
-    async def fetch_character_bio(self, interaction: Interaction, char_id: int) -> str:
-        
-        soup = await self.fetch_character_profile(interaction, char_id)
-        bio = soup.find("div", class_="character__selfintroduction")
-        
-        return bio.text
-    
+
+        self._profile_cache.set(int(char_id), character.to_dict())
+        return character
+
+################################################################################
+    async def fetch_character_bio(self, interaction: Interaction, char_id: int) -> Optional[str]:
+
+        # The verification code was only just added, so a cached bio is useless.
+        if character := await self.fetch_character(interaction, char_id, fresh=True):
+            return character.bio
+
 ################################################################################
     async def fetch_character_name(self, interaction: Interaction, char_id: int) -> Optional[str]:
 
-        soup = await self.fetch_character_profile(interaction, char_id)
-        if name := soup.find("p", class_="frame__chara__name"):
-            return name.text
-    
+        if character := await self.fetch_character(interaction, char_id):
+            return character.name
+
 ################################################################################
-    
\ No newline at end of file
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Optional
+
+from logger import log
+
+if TYPE_CHECKING:
+    from discord.http import HTTPClient, Route
+################################################################################
+
+__all__ = ("RESTAudit", )
+
+################################################################################
+class RESTAudit:
+    """Counts Discord REST calls by endpoint while active."""
+
+    __slots__ = (
+        "_http",
+        "_original",
+        "_counts",
+    )
+
+################################################################################
+    def __init__(self, http: HTTPClient) -> None:
+
+        self._http: HTTPClient = http
+        self._original: Optional[Any] = None
+        self._counts: Counter[str] = Counter()
+
+################################################################################
+    def __len__(self) -> int:
+
+        return sum(self._counts.values())
+
+################################################################################
+    def start(self) -> None:
+
+        if self._original is not None:
+            return
+
+        original = self._original = self._http.request
+
+        async def request(route: Route, **kwargs) -> Any:
+            self._counts[f"{route.method} {route.path}"] += 1
+            return await original(route, **kwargs)
+
+        self._http.request = request  # type: ignore
+
+################################################################################
+    def stop(self) -> None:
+
+        if self._original is None:
+            return
+
+        self._http.request = self._original  # type: ignore
+        self._original = None
+
+################################################################################
+    def report(self, title: str) -> None:
+
+        log.info(None, f"{title}: {len(self)} REST call(s) across {len(self._counts)} endpoint(s)")
+        for endpoint, count in self._counts.most_common():
+            log.info(None, f"  {count:>5} x {endpoint}")
+
+################################################################################
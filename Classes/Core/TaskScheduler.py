@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, UTC
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import FroggeBot
+################################################################################
+
+__all__ = ("TaskScheduler",)
+
+ScheduledCallback = Callable[[], Awaitable[Any]]
+
+################################################################################
+class _ScheduledTask:
+
+    __slots__ = (
+        "when",
+        "seq",
+        "key",
+        "callback",
+        "cancelled",
+    )
+
+    def __init__(self, when: datetime, seq: int, key: Hashable, callback: ScheduledCallback) -> None:
+
+        self.when: datetime = when
+        self.seq: int = seq
+        self.key: Hashable = key
+        self.callback: ScheduledCallback = callback
+        self.cancelled: bool = False
+
+    def __lt__(self, other: _ScheduledTask) -> bool:
+
+        return (self.when, self.seq) < (other.when, other.seq)
+
+################################################################################
+class TaskScheduler:
+    """Runs callbacks at registered deadlines without polling."""
+
+    __slots__ = (
+        "_state",
+        "_heap",
+        "_tasks",
+        "_counter",
+        "_wakeup",
+        "_runner",
+        "_inflight",
+    )
+
+################################################################################
+    def __init__(self, bot: FroggeBot) -> None:
+
+        self._state: FroggeBot = bot
+
+        self._heap: List[_ScheduledTask] = []
+        self._tasks: Dict[Hashable, _ScheduledTask] = {}
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._tasks)
+
+################################################################################
+    def __contains__(self, key: Hashable) -> bool:
+
+        return key in self._tasks
+
+################################################################################
+    @property
+    def bot(self) -> FroggeBot:
+
+        return self._state
+
+################################################################################
+    def schedule(self, key: Hashable, when: datetime, callback: ScheduledCallback) -> None:
+
+        self.cancel(key)
+
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+
+        task = _ScheduledTask(when, next(self._counter), key, callback)
+        self._tasks[key] = task
+        heapq.heappush(self._heap, task)
+
+        self._ensure_running()
+
+        # Only wake the runner if this deadline is now the earliest one.
+        if self._heap[0] is task:
+            self._wakeup.set()
+
+################################################################################
+    def cancel(self, key: Hashable) -> None:
+
+        if task := self._tasks.pop(key, None):
+            task.cancelled = True
+
+################################################################################
+    def deadline(self, key: Hashable) -> Optional[datetime]:
+
+        task = self._tasks.get(key)
+        return task.when if task is not None else None
+
+################################################################################
+    def _ensure_running(self) -> None:
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+
+################################################################################
+    def stop(self) -> None:
+
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            # Discard cancelled/replaced entries sitting at the top of the heap.
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = (self._heap[0].when - datetime.now(UTC)).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            task = heapq.heappop(self._heap)
+            self._tasks.pop(task.key, None)
+            # Fire without blocking the runner; hold a reference until done.
+            fired = asyncio.create_task(self._fire(task))
+            self._inflight.add(fired)
+            fired.add_done_callback(self._inflight.discard)
+
+################################################################################
+    @staticmethod
+    async def _fire(task: _ScheduledTask) -> None:
+
+        try:
+            await task.callback()
+        except Exception as ex:
+            log.error(None, f"Scheduled task {task.key} failed: {ex!r}")
+
+################################################################################
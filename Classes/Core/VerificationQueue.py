@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Dict
+
+from discord import Interaction
+
+from Utilities import Utilities as U
+from Utilities.Constants import (
+    MAX_CONCURRENT_VERIFICATIONS,
+    MAX_CONCURRENT_VERIFICATIONS_PER_GUILD,
+    VERIFICATION_QUEUE_LIMIT,
+)
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import FroggeBot
+################################################################################
+
+__all__ = ("VerificationQueue", )
+
+################################################################################
+class VerificationQueue:
+    """Bot-wide admission control for the backend half of `/verify`."""
+
+    __slots__ = (
+        "_state",
+        "_waiting",
+        "_active",
+        "_total",
+    )
+
+################################################################################
+    def __init__(self, bot: FroggeBot) -> None:
+
+        self._state: FroggeBot = bot
+
+        # guild_id -> waiters; dict order doubles as the round-robin order.
+        self._waiting: Dict[int, Deque[asyncio.Future]] = {}
+        self._active: Dict[int, int] = {}
+        self._total: int = 0
+
+################################################################################
+    @property
+    def bot(self) -> FroggeBot:
+
+        return self._state
+
+################################################################################
+    def _has_capacity(self, guild_id: int) -> bool:
+
+        return (
+            self._total < MAX_CONCURRENT_VERIFICATIONS
+            and self._active.get(guild_id, 0) < MAX_CONCURRENT_VERIFICATIONS_PER_GUILD
+        )
+
+################################################################################
+    def _grant(self, guild_id: int) -> None:
+
+        self._total += 1
+        self._active[guild_id] = self._active.get(guild_id, 0) + 1
+
+################################################################################
+    def _dispatch(self) -> None:
+
+        while self._total < MAX_CONCURRENT_VERIFICATIONS:
+            guild_id = next((g for g in self._waiting if self._has_capacity(g)), None)
+            if guild_id is None:
+                return
+
+            # Move the guild to the back of the rotation once served.
+            waiters = self._waiting.pop(guild_id)
+            future = waiters.popleft()
+            if waiters:
+                self._waiting[guild_id] = waiters
+
+            if not future.done():
+                future.set_result(None)
+                self._grant(guild_id)
+
+################################################################################
+    def _discard(self, guild_id: int, future: asyncio.Future) -> None:
+
+        waiters = self._waiting.get(guild_id)
+        if waiters is None:
+            return
+
+        try:
+            waiters.remove(future)
+        except ValueError:
+            pass
+
+        if not waiters:
+            del self._waiting[guild_id]
+
+################################################################################
+    def release(self, guild_id: int) -> None:
+
+        self._total -= 1
+        self._active[guild_id] -= 1
+        if not self._active[guild_id]:
+            del self._active[guild_id]
+
+        self._dispatch()
+
+################################################################################
+    async def acquire(self, interaction: Interaction, guild_id: int) -> bool:
+
+        waiters = self._waiting.get(guild_id)
+        if not waiters and self._has_capacity(guild_id):
+            self._grant(guild_id)
+            return True
+
+        if waiters and len(waiters) >= VERIFICATION_QUEUE_LIMIT:
+            log.warning(None, f"Verification queue full for guild {guild_id}; turning user away.")
+            error = U.make_error(
+                title="Verification Queue Full",
+                message="Too many users are verifying in this server right now.",
+                solution="Please wait a minute or two and try again."
+            )
+            await interaction.respond(embed=error, ephemeral=True)
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(guild_id, deque()).append(future)
+        position = len(self._waiting[guild_id])
+
+        try:
+            prompt = U.make_embed(
+                title="__Verification Queued__",
+                description=(
+                    f"You are **#{position}** in line to be verified. Your "
+                    "verification will continue automatically - there's no "
+                    "need to run the command again."
+                )
+            )
+            await interaction.respond(embed=prompt, ephemeral=True)
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we were cancelled; hand it on.
+                self.release(guild_id)
+            else:
+                future.cancel()
+                self._discard(guild_id, future)
+            raise
+
+        return True
+
+################################################################################
+    @asynccontextmanager
+    async def slot(self, interaction: Interaction, guild_id: int) -> AsyncIterator[bool]:
+
+        admitted = await self.acquire(interaction, guild_id)
+        try:
+            yield admitted
+        finally:
+            if admitted:
+                self.release(guild_id)
+
+################################################################################
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+from Classes.Common import TTLCache
+from Utilities.Constants import IDENTITY_REVALIDATE_INTERVAL_SECONDS, LODESTONE_CACHE_SIZE
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import FroggeBot, VerificationData
+################################################################################
+
+__all__ = ("VerifiedIdentityIndex", )
+
+################################################################################
+class VerifiedIdentityIndex:
+    """Process-wide map of user ID -> the character they last verified as."""
+
+    __slots__ = (
+        "_state",
+        "_identities",
+        "_inflight",
+        "_checked",
+    )
+
+################################################################################
+    def __init__(self, bot: FroggeBot) -> None:
+
+        self._state: FroggeBot = bot
+
+        self._identities: Dict[int, VerificationData] = {}
+        self._inflight: Set[asyncio.Task] = set()
+        # Users re-checked recently enough to skip another Lodestone fetch.
+        self._checked: TTLCache[bool] = TTLCache(IDENTITY_REVALIDATE_INTERVAL_SECONDS, LODESTONE_CACHE_SIZE)
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._identities)
+
+################################################################################
+    @property
+    def bot(self) -> FroggeBot:
+
+        return self._state
+
+################################################################################
+    def register(self, verification: VerificationData) -> None:
+
+        self._identities[verification.user_id] = verification
+
+################################################################################
+    def get(self, user_id: int) -> Optional[VerificationData]:
+
+        return self._identities.get(user_id)
+
+################################################################################
+    def revalidate(self, user_id: int) -> None:
+
+        if (verification := self._identities.get(user_id)) is None:
+            return
+        if self._checked.get(user_id):
+            return
+
+        self._checked.set(user_id, True)
+
+        # Hold a reference until done so the task isn't collected mid-flight.
+        task = asyncio.create_task(self._revalidate(verification))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+################################################################################
+    async def _revalidate(self, verification: VerificationData) -> None:
+
+        # A cached profile would only tell us what we already knew.
+        character = await self.bot.lodestone.fetch_character(None, verification.lodestone_id, fresh=True)
+
+        # A failed lookup is treated as a mismatch; the worst case is that
+        # the user does the full round trip next time.
+        if character is None or (character.name or "").lower() != verification.name.lower():
+            log.warning(
+                None,
+                f"Shared identity for user {verification.user_id} no longer matches "
+                f"Lodestone ID {verification.lodestone_id}; dropping it."
+            )
+            # Only drop it if it hasn't been replaced in the meantime.
+            if self._identities.get(verification.user_id) is verification:
+                del self._identities[verification.user_id]
+
+################################################################################
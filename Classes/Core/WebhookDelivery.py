@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from discord import File, Forbidden, HTTPException, NotFound, TextChannel, Webhook
+
+from Utilities import Attachments
+from Utilities.Constants import WEBHOOK_DELIVERY_ENABLED
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import FroggeBot
+################################################################################
+
+__all__ = ("WebhookDelivery", )
+
+################################################################################
+class WebhookDelivery:
+    """Sends fire-and-forget messages through a per-channel webhook."""
+
+    __slots__ = (
+        "_state",
+        "_hooks",
+        "_unsupported",
+        "_own_updates",
+        "_locks",
+    )
+
+    WEBHOOK_NAME = "FroggeBot Relay"
+
+################################################################################
+    def __init__(self, bot: FroggeBot) -> None:
+
+        self._state: FroggeBot = bot
+
+        self._hooks: Dict[int, Webhook] = {}
+        self._unsupported: Set[int] = set()
+        # Channels whose next webhooks update is our own creation.
+        self._own_updates: Set[int] = set()
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+################################################################################
+    @property
+    def bot(self) -> FroggeBot:
+
+        return self._state
+
+################################################################################
+    def invalidate(self, channel_id: int) -> None:
+
+        if channel_id in self._own_updates:
+            self._own_updates.discard(channel_id)
+            return
+
+        self._hooks.pop(channel_id, None)
+        self._unsupported.discard(channel_id)
+
+################################################################################
+    async def _get_webhook(self, channel: TextChannel) -> Optional[Webhook]:
+
+        if channel.id in self._unsupported:
+            return
+
+        if hook := self._hooks.get(channel.id):
+            return hook
+
+        # Concurrent first sends would otherwise each create a webhook.
+        async with self._locks.setdefault(channel.id, asyncio.Lock()):
+            if channel.id in self._unsupported:
+                return
+            if hook := self._hooks.get(channel.id):
+                return hook
+
+            return await self._find_or_create(channel)
+
+################################################################################
+    async def _find_or_create(self, channel: TextChannel) -> Optional[Webhook]:
+
+        try:
+            hook = next(
+                (
+                    h for h in await channel.webhooks()
+                    if h.user is not None and h.user.id == self.bot.user.id
+                    and h.name == self.WEBHOOK_NAME
+                ),
+                None
+            )
+            if hook is None:
+                self._own_updates.add(channel.id)
+                hook = await channel.create_webhook(name=self.WEBHOOK_NAME)
+        except (Forbidden, HTTPException):
+            self._own_updates.discard(channel.id)
+            log.info(None, f"Webhook delivery unavailable in channel {channel.id}; using direct sends.")
+            self._unsupported.add(channel.id)
+            return
+
+        self._hooks[channel.id] = hook
+        return hook
+
+################################################################################
+    @staticmethod
+    def _read_files(kwargs: Dict[str, Any]) -> List[Tuple[bytes, str]]:
+
+        files: List[File] = kwargs.pop("files", None) or []
+        if (file := kwargs.pop("file", None)) is not None:
+            files.append(file)
+
+        return [(f.fp.read(), f.filename) for f in files]
+
+################################################################################
+    async def send(self, channel: TextChannel, **kwargs) -> None:
+
+        # A File is consumed by its first send, so keep the bytes and build
+        # fresh ones for each attempt.
+        files = self._read_files(kwargs)
+        if files:
+            kwargs["files"] = [Attachments.from_bytes(data, name) for data, name in files]
+
+        hook = await self._get_webhook(channel) if WEBHOOK_DELIVERY_ENABLED else None
+        if hook is not None:
+            try:
+                await hook.send(
+                    username=self.bot.user.display_name,
+                    avatar_url=self.bot.user.display_avatar.url,
+                    **kwargs
+                )
+                return
+            except NotFound:
+                # Webhook was deleted out from under us.
+                self._hooks.pop(channel.id, None)
+                if files:
+                    kwargs["files"] = [Attachments.from_bytes(data, name) for data, name in files]
+
+        await channel.send(**kwargs)
+
+################################################################################
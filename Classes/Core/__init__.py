@@ -1,8 +1,16 @@
 from .APIClient import APIClient
 from .Bot import FroggeBot
+from .CaptchaPool import CaptchaPool
+from .DMNotifier import DMNotifier, DeliveryReport
 from .GuildConfig import GuildConfiguration
 from .GuildData import GuildData
 from .GuildLogger import GuildLogger
 from .GuildManager import GuildManager
+from .LodestoneCharacter import LodestoneCharacter
 from .LodestoneClient import LodestoneClient
+from .RESTAudit import RESTAudit
+from .TaskScheduler import TaskScheduler
+from .VerificationQueue import VerificationQueue
+from .VerifiedIdentityIndex import VerifiedIdentityIndex
+from .WebhookDelivery import WebhookDelivery
 ################################################################################
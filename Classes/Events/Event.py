@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, UTC, time
 from typing import TYPE_CHECKING, List, Optional, Dict, Type, TypeVar, Any
 
@@ -9,7 +10,6 @@ from discord import (
     Message,
     EmbedField,
     Interaction,
-    Thread,
     ChannelType,
     Forbidden,
     SelectOption,
@@ -18,7 +18,7 @@ from discord import (
 from discord.ext.pages import Page
 
 from Assets import BotEmojis
-from Classes.Common import ManagedObject, LazyMessage
+from Classes.Common import ManagedObject, LazyMessage, PostRefresher
 from Enums import ElementType
 from Enums import Minutes, Hours
 from Errors import InvalidNumber, ChannelNotSet, InsufficientPermissions
@@ -35,11 +35,17 @@ from UI.Events import (
     EventPositionSelectView,
 )
 from Utilities import Utilities as U
+from Utilities.Constants import (
+    DEFAULT_SCHEDULE_NOTIFY_MINUTES,
+    EVENT_ARCHIVE_DELAY_HOURS,
+    EVENT_POST_REFRESH_SECONDS,
+)
 from logger import log
 from .EventDetails import EventDetails
 from .EventPosition import EventPosition
 from .EventSignup import EventSignup
 from .ShiftBracket import ShiftBracket
+from .ShiftCoverage import ShiftCoverage
 
 if TYPE_CHECKING:
     from Classes import EventManager, EventElement, StaffMember
@@ -51,7 +57,7 @@ __all__ = ("Event", )
 E = TypeVar("E", bound="Event")
 
 ################################################################################
-class Event(ManagedObject):
+class Event(ManagedObject, PostRefresher):
 
     __slots__ = (
         "_details",
@@ -59,6 +65,8 @@ class Event(ManagedObject):
         "_positions",
         "_post_msg",
         "_is_template",
+        "_coverage",
+        "_refresher",
     )
 
 ################################################################################
@@ -72,6 +80,8 @@ class Event(ManagedObject):
         self._is_template: bool = kwargs.get("is_template", False)
 
         self._post_msg: LazyMessage = LazyMessage(self, kwargs.get("post_url"))
+        self._coverage: Optional[ShiftCoverage] = None
+        self._init_refresher(EVENT_POST_REFRESH_SECONDS)
 
 ################################################################################
     @classmethod
@@ -95,6 +105,8 @@ class Event(ManagedObject):
         self._is_template = data.get("is_template", False)
 
         self._post_msg = LazyMessage(self, data.get("post_url"))
+        self._coverage = None
+        self._init_refresher(EVENT_POST_REFRESH_SECONDS)
 
         return self
 
@@ -108,6 +120,7 @@ class Event(ManagedObject):
         # Transfer the relevant details from the template to the new event
         new_event._details = EventDetails.copy(new_event, template)
         new_event._shifts = [ShiftBracket.copy(new_event, s) for s in template._shifts]
+        new_event.invalidate_coverage()
         new_event._positions = [EventPosition.copy(new_event, p) for p in template._positions]
 
         new_event.update()
@@ -195,12 +208,51 @@ class Event(ManagedObject):
 
 ################################################################################
     @property
-    def is_locked_out(self) -> bool:
+    def notify_time(self) -> Optional[datetime]:
 
         if self.start_time is None:
+            return
+
+        start_time = U.ensure_timezone(self.start_time, self.timezone)
+        return start_time - timedelta(minutes=DEFAULT_SCHEDULE_NOTIFY_MINUTES)
+
+################################################################################
+    @property
+    def lockout_time(self) -> Optional[datetime]:
+
+        if self.start_time is None:
+            return
+
+        start_time = U.ensure_timezone(self.start_time, self.timezone)
+        return start_time - timedelta(minutes=self._mgr.lockout_threshold)  # type: ignore
+
+################################################################################
+    @property
+    def is_locked_out(self) -> bool:
+
+        if self.lockout_time is None:
+            return False
+
+        return self.lockout_time < datetime.now(UTC)
+
+################################################################################
+    @property
+    def archive_time(self) -> Optional[datetime]:
+
+        if self.end_time is None:
+            return
+
+        end_time = U.ensure_timezone(self.end_time, self.timezone)
+        return end_time + timedelta(hours=EVENT_ARCHIVE_DELAY_HOURS)
+
+################################################################################
+    @property
+    def is_archivable(self) -> bool:
+
+        if self.is_template or self.archive_time is None:
             return False
 
-        return self.start_time - timedelta(minutes=self._mgr.lockout_threshold) < datetime.now(UTC)  # type: ignore
+        return self.archive_time < datetime.now(UTC)
 
 ################################################################################
     @property
@@ -216,6 +268,7 @@ class Event(ManagedObject):
 ################################################################################
     def delete(self) -> None:
 
+        self.cancel_deadlines()
         self.bot.api.delete_event(self.id)
         self.manager._managed.remove(self)
 
@@ -274,13 +327,6 @@ class Event(ManagedObject):
                 ]
             )
 
-        shift_emoji = BotEmojis.Check if self.is_fully_covered() else BotEmojis.Cross
-        shift_coverage_str = (
-            "`Shifts Match Event Time`"
-            if self.is_fully_covered()
-            else "`Missing Shift Time(s)`"
-        )
-
         post_message = await self.post_message
         return U.make_embed(
             title=f"__{self.name}__",
@@ -306,7 +352,7 @@ class Event(ManagedObject):
                 EmbedField(
                     name="__Shift Brackets__",
                     value=(
-                        f"{str(shift_emoji)} {shift_coverage_str} {str(shift_emoji)}\n"
+                        f"{self.coverage_status()}\n"
                         f"{shift_value}"
                     ),
                     inline=False
@@ -357,13 +403,6 @@ class Event(ManagedObject):
                 ]
             )
 
-        shift_emoji = BotEmojis.Check if self.is_fully_covered() else BotEmojis.Cross
-        shift_coverage_str = (
-            "`Shifts Match Event Time`"
-            if self.is_fully_covered()
-            else "`Missing Shift Time(s)`"
-        )
-
         return U.make_embed(
             title=f"__{self.name}__",
             footer_text=f"ID: {self.id}",
@@ -377,7 +416,7 @@ class Event(ManagedObject):
                 EmbedField(
                     name="__Shift Brackets__",
                     value=(
-                        f"{str(shift_emoji)} {shift_coverage_str} {str(shift_emoji)}\n"
+                        f"{self.coverage_status()}\n"
                         f"{shift_value}"
                     ),
                     inline=False
@@ -426,6 +465,11 @@ class Event(ManagedObject):
 
         main_event_embed = U.make_embed(
             title=f"__{self.name}__",
+            description=(
+                f"{BotEmojis.Lock} **Signups for this event are closed.** {BotEmojis.Lock}"
+                if self.is_locked_out
+                else None
+            ),
             footer_text=f"ID: {self.id}",
             thumbnail_url=self.image,
             fields=[
@@ -464,22 +508,50 @@ class Event(ManagedObject):
         return EventStatusView(user, self)
 
 ################################################################################
-    def is_fully_covered(self) -> bool:
+    @property
+    def coverage(self) -> Optional[ShiftCoverage]:
 
         if self.start_time is None or self.end_time is None:
-            return False
+            return
+
+        if self._coverage is None:
+            self._coverage = ShiftCoverage(
+                U.ensure_timezone(self.start_time, self.timezone),
+                U.ensure_timezone(self.end_time, self.timezone),
+                self.shifts
+            )
 
-        start_time_with_tz = U.ensure_timezone(self.start_time, self.timezone)
-        end_time_with_tz = U.ensure_timezone(self.end_time, self.timezone)
+        return self._coverage
 
-        # Adjust end time if it is on the next day
-        if end_time_with_tz < start_time_with_tz:
-            end_time_with_tz += timedelta(days=1)
+################################################################################
+    def invalidate_coverage(self) -> None:
 
-        event_duration = int((end_time_with_tz - start_time_with_tz).total_seconds() / 60)
-        total_shift_length = sum(bracket.length for bracket in self.shifts)
+        self._coverage = None
 
-        return total_shift_length >= event_duration
+################################################################################
+    def is_fully_covered(self) -> bool:
+
+        coverage = self.coverage
+        return coverage is not None and coverage.is_fully_covered
+
+################################################################################
+    def coverage_status(self) -> str:
+
+        coverage = self.coverage
+        if coverage is not None and coverage.is_fully_covered:
+            ret = f"{str(BotEmojis.Check)} `Shifts Match Event Time` {str(BotEmojis.Check)}"
+        else:
+            ret = f"{str(BotEmojis.Cross)} `Missing Shift Time(s)` {str(BotEmojis.Cross)}"
+
+        if coverage is None:
+            return ret
+
+        for start, end in coverage.gaps:
+            ret += f"\n**Gap:** {U.format_dt(start, 't')} - {U.format_dt(end, 't')}"
+        for start, end in coverage.overlaps:
+            ret += f"\n**Overlap:** {U.format_dt(start, 't')} - {U.format_dt(end, 't')}"
+
+        return ret
 
 ################################################################################
     async def set_name(self, interaction: Interaction) -> None:
@@ -519,13 +591,6 @@ class Event(ManagedObject):
                 ]
             )
 
-        shift_emoji = BotEmojis.Check if self.is_fully_covered() else BotEmojis.Cross
-        shift_coverage_str = (
-            "`Shifts Match Event Time`"
-            if self.is_fully_covered()
-            else "`Missing Shift Time(s)`"
-        )
-
         return U.make_embed(
             title="Shift Bracket Menu",
             fields=[
@@ -542,7 +607,7 @@ class Event(ManagedObject):
                 EmbedField(
                     name="__Current Shift Brackets:__",
                     value=(
-                        f"{str(shift_emoji)} {shift_coverage_str} {str(shift_emoji)}\n"
+                        f"{self.coverage_status()}\n"
                         f"{shift_value}"
                     ),
                     inline=False
@@ -664,36 +729,34 @@ class Event(ManagedObject):
         else:
             shift_end_date = start_date
 
-        new_bracket = ShiftBracket.new(
-            parent=self,
-            start_time=self.py_tz.localize(
-                datetime(
-                    year=shift_start_date.year,
-                    month=shift_start_date.month,
-                    day=shift_start_date.day,
-                    hour=shift_start_time.hour,
-                    minute=shift_start_time.minute
-                )
-            ),
-            end_time=self.py_tz.localize(
-                datetime(
-                    year=shift_end_date.year,
-                    month=shift_end_date.month,
-                    day=shift_end_date.day,
-                    hour=shift_end_time.hour,
-                    minute=shift_end_time.minute
-                )
+        bracket_start = self.py_tz.localize(
+            datetime(
+                year=shift_start_date.year,
+                month=shift_start_date.month,
+                day=shift_start_date.day,
+                hour=shift_start_time.hour,
+                minute=shift_start_time.minute
+            )
+        )
+        bracket_end = self.py_tz.localize(
+            datetime(
+                year=shift_end_date.year,
+                month=shift_end_date.month,
+                day=shift_end_date.day,
+                hour=shift_end_time.hour,
+                minute=shift_end_time.minute
             )
         )
 
-        if any(bracket.overlaps_with(new_bracket) for bracket in self.shifts):
+        # Validate against the merged coverage before anything hits the API.
+        if self.coverage.conflicts_with(bracket_start, bracket_end):
             log.warning(self.guild, "Conflicting shift bracket detected.")
             error = U.make_error(
                 title="Conflicting Shift Bracket",
                 description=(
                     f"**Problem Range:** "
-                    f"{U.format_dt(new_bracket.start_time, 't')} - "
-                    f"{U.format_dt(new_bracket.end_time, 't')}"
+                    f"{U.format_dt(bracket_start, 't')} - "
+                    f"{U.format_dt(bracket_end, 't')}"
                 ),
                 message=(
                     "The shift bracket you are trying to create conflicts with "
@@ -705,11 +768,11 @@ class Event(ManagedObject):
                     "of the event."
                 )
             )
-            new_bracket.delete()
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        self._shifts.append(new_bracket)
+        self._shifts.append(ShiftBracket.new(self, bracket_start, bracket_end))
+        self.invalidate_coverage()
 
         log.info(self.guild, f"Shift bracket added to event {self.name} ({self.id}).")
 
@@ -961,24 +1024,28 @@ class Event(ManagedObject):
         log.info(self.guild, "Posting event to forum channel.")
 
         name_string = f"{self.name.lower()} - {self.start_time.date().strftime('%m/%d')}"
-        matching_thread = next((t for t in channel.threads if t.name.lower() == name_string), None)
+        thread_index = self.guild.thread_index
+        matching_thread = await thread_index.get(channel, name_string)  # type: ignore
         tags = []
 
-        if matching_thread:
-            # Clear the matching thread
-            await matching_thread.edit(applied_tags=tags)
-            action = matching_thread.send  # type: ignore
-        else:
-            # Or create a new thread if no matching one
-            action = lambda **kw: channel.create_thread(name=name_string, applied_tags=tags, **kw)  # type: ignore
-
-        # Post or create thread and handle permissions error
+        # Edit the matching thread's starter message in place (or post into the
+        # thread if the bot didn't write it), or create a new thread if there
+        # isn't one, and handle permissions errors
         try:
-            result = await action(embeds=await self.compile(), view=view)
-            if isinstance(result, Thread):
-                self.post_message = await result.fetch_message(result.last_message_id)
+            if matching_thread is not None:
+                await matching_thread.edit(applied_tags=tags)
+                starter = await thread_index.own_starter_message(matching_thread)
+                if starter is not None:
+                    await starter.edit(embeds=await self.compile(), view=view)
+                    self.post_message = starter
+                else:
+                    self.post_message = await matching_thread.send(embeds=await self.compile(), view=view)
             else:
-                self.post_message = result
+                result = await channel.create_thread(  # type: ignore
+                    name=name_string, applied_tags=tags, embeds=await self.compile(), view=view
+                )
+                thread_index.register(result)
+                self.post_message = await thread_index.starter_message(result)
         except Forbidden:
             log.warning(self.guild, "Insufficient permissions to post event.")
             error = InsufficientPermissions(channel, "Send Messages")
@@ -1207,6 +1274,97 @@ class Event(ManagedObject):
 
         signup.delete()
 
+################################################################################
+    def register_deadlines(self) -> None:
+
+        self.cancel_deadlines()
+
+        if self.is_template:
+            return
+
+        if self.archive_time is not None:
+            self.bot.scheduler.schedule(
+                ("event_archive", self.id),
+                self.archive_time,
+                lambda: self.manager.archive_event(self)  # type: ignore
+            )
+
+        if self.start_time is None:
+            return
+
+        now = datetime.now(UTC)
+        start_time = U.ensure_timezone(self.start_time, self.timezone)
+        if start_time <= now:
+            return
+
+        # Reminders that were already due are skipped rather than sent late so
+        # a restart doesn't re-DM the whole roster.
+        if self.notify_time > now:
+            self.bot.scheduler.schedule(("event_notify", self.id), self.notify_time, self.notify_staff)
+
+        # Locking is idempotent, so a lockout that's already passed fires immediately.
+        self.bot.scheduler.schedule(("event_lockout", self.id), self.lockout_time, self.lock_signups)
+
+################################################################################
+    def cancel_deadlines(self) -> None:
+
+        self.bot.scheduler.cancel(("event_notify", self.id))
+        self.bot.scheduler.cancel(("event_lockout", self.id))
+        self.bot.scheduler.cancel(("event_archive", self.id))
+
+################################################################################
+    async def notify_staff(self) -> None:
+
+        log.info(self.guild, f"Sending shift reminders for event {self.name} ({self.id}).")
+
+        brackets: Dict[StaffMember, List[ShiftBracket]] = {}
+        for signup in self.signups:
+            brackets.setdefault(signup.staff_member, []).append(signup.bracket)
+
+        if not brackets:
+            return
+
+        users = await asyncio.gather(*(staff.user for staff in brackets), return_exceptions=True)
+        users = [None if isinstance(u, Exception) else u for u in users]
+        messages = [
+            (user, {"embed": self._reminder_embed(shifts)})
+            for user, shifts in zip(users, brackets.values())
+            if user is not None
+        ]
+        report = await self.bot.notifier.send_many(
+            self.guild, messages, unresolved=len(users) - len(messages)
+        )
+
+        log.info(self.guild, f"Shift reminders: {report.summary()}.")
+
+################################################################################
+    def _reminder_embed(self, shifts: List[ShiftBracket]) -> Embed:
+
+        return U.make_embed(
+            title="__Upcoming Shift Reminder__",
+            description=(
+                f"You're scheduled to work **{self.name}** "
+                f"{U.format_dt(self.start_time, 'R')} in **{self.guild.name}**!\n\n"
+
+                "__Your Shift(s):__\n" +
+                "\n".join(
+                    f"* {U.format_dt(s.start_time, 't')} - {U.format_dt(s.end_time, 't')}"
+                    for s in sorted(shifts, key=lambda s: s.start_time)
+                )
+            ),
+            thumbnail_url=self.image,
+            footer_text=f"Event ID: {self.id}"
+        )
+
+################################################################################
+    async def lock_signups(self) -> None:
+
+        log.info(self.guild, f"Locking signups for event {self.name} ({self.id}).")
+
+        # The signup view reads `is_locked_out` when built, so a re-render is all
+        # that's needed to disable the buttons.
+        await self.update_post_components()
+
 ################################################################################
     async def process_employee_punch(self, interaction: Interaction) -> None:
 
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from Utilities.Constants import EVENT_ARCHIVE_DIR
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import Event, EventManager, GuildData
+################################################################################
+
+__all__ = ("EventArchive", "ArchivedEvent")
+
+################################################################################
+class ArchivedEvent:
+
+    __slots__ = (
+        "_id",
+        "_name",
+        "_start",
+        "_end",
+        "_roster",
+    )
+
+################################################################################
+    def __init__(self, _id: int, **kwargs) -> None:
+
+        self._id: int = _id
+
+        self._name: Optional[str] = kwargs.get("name")
+        self._start: Optional[datetime] = kwargs.get("start_time")
+        self._end: Optional[datetime] = kwargs.get("end_time")
+        # (position_name, staff_id, user_id, shift_start, shift_end)
+        self._roster: List[Tuple[str, int, int, datetime, datetime]] = kwargs.get("roster", [])
+
+################################################################################
+    @classmethod
+    def from_event(cls, event: Event) -> ArchivedEvent:
+
+        return cls(
+            event.id,
+            name=event.name,
+            start_time=event.start_time,
+            end_time=event.end_time,
+            roster=[
+                (
+                    signup.parent.position.name,
+                    signup.staff_member.id,
+                    signup.staff_member._user.id,
+                    signup.bracket.start_time,
+                    signup.bracket.end_time,
+                )
+                for signup in event.signups
+                if signup.staff_member is not None and signup.bracket is not None
+            ]
+        )
+
+################################################################################
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ArchivedEvent:
+
+        return cls(
+            data["id"],
+            name=data["name"],
+            start_time=datetime.fromisoformat(data["start_time"]) if data["start_time"] else None,
+            end_time=datetime.fromisoformat(data["end_time"]) if data["end_time"] else None,
+            roster=[
+                (pos, staff_id, user_id, datetime.fromisoformat(start), datetime.fromisoformat(end))
+                for pos, staff_id, user_id, start, end in data["roster"]
+            ]
+        )
+
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
+################################################################################
+    @property
+    def name(self) -> Optional[str]:
+
+        return self._name
+
+################################################################################
+    @property
+    def start_time(self) -> Optional[datetime]:
+
+        return self._start
+
+################################################################################
+    @property
+    def end_time(self) -> Optional[datetime]:
+
+        return self._end
+
+################################################################################
+    @property
+    def roster(self) -> List[Tuple[str, int, int, datetime, datetime]]:
+
+        return self._roster
+
+################################################################################
+    @property
+    def staff_ids(self) -> List[int]:
+
+        return list(dict.fromkeys(staff_id for _, staff_id, _, _, _ in self._roster))
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "id": self._id,
+            "name": self._name,
+            "start_time": self._start.isoformat() if self._start else None,
+            "end_time": self._end.isoformat() if self._end else None,
+            "roster": [
+                [pos, staff_id, user_id, start.isoformat(), end.isoformat()]
+                for pos, staff_id, user_id, start, end in self._roster
+            ]
+        }
+
+################################################################################
+class EventArchive:
+    """Cold storage for ended events."""
+
+    __slots__ = (
+        "_mgr",
+        "_offsets",
+        "_records",
+        "_by_staff",
+    )
+
+################################################################################
+    def __init__(self, mgr: EventManager) -> None:
+
+        self._mgr: EventManager = mgr
+
+        # Disk mode: event ID -> byte offset. Memory mode: event ID -> record.
+        self._offsets: Dict[int, int] = {}
+        self._records: Dict[int, ArchivedEvent] = {}
+        self._by_staff: Dict[int, List[int]] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._offsets) + len(self._records)
+
+################################################################################
+    def __contains__(self, event_id: int) -> bool:
+
+        return int(event_id) in self._offsets or int(event_id) in self._records
+
+################################################################################
+    @property
+    def guild(self) -> GuildData:
+
+        return self._mgr.guild
+
+################################################################################
+    @property
+    def path(self) -> Optional[str]:
+
+        if not EVENT_ARCHIVE_DIR:
+            return
+
+        return f"{EVENT_ARCHIVE_DIR}{self._mgr.guild_id}.jsonl"
+
+################################################################################
+    async def load(self) -> None:
+
+        self._offsets.clear()
+        self._records.clear()
+        self._by_staff.clear()
+
+        path = self.path
+        if path is None:
+            return
+
+        def _scan() -> Tuple[List[Tuple[ArchivedEvent, int]], int]:
+            found, skipped = [], 0
+            if not os.path.exists(path):
+                return found, skipped
+            with open(path, "rb") as file:
+                while True:
+                    offset = file.tell()
+                    line = file.readline()
+                    if not line:
+                        break
+                    # A corrupt line only costs that record, not the rest.
+                    try:
+                        found.append((ArchivedEvent.from_dict(json.loads(line)), offset))
+                    except (ValueError, KeyError, TypeError):
+                        skipped += 1
+            return found, skipped
+
+        try:
+            found, skipped = await asyncio.to_thread(_scan)
+        except OSError as e:
+            log.error(self.guild, f"Error reading event archive {path}: {e.args}")
+            return
+
+        for record, offset in found:
+            self._index(record, offset)
+
+        if skipped:
+            log.warning(self.guild, f"Skipped {skipped} unreadable line(s) in {path}.")
+        log.info(self.guild, f"Indexed {len(self)} archived event(s).")
+
+################################################################################
+    def _index(self, record: ArchivedEvent, offset: Optional[int]) -> None:
+
+        if offset is None:
+            self._records[record.id] = record
+        else:
+            self._offsets[record.id] = offset
+
+        for staff_id in record.staff_ids:
+            self._by_staff.setdefault(staff_id, []).append(record.id)
+
+################################################################################
+    async def add(self, event: Event) -> Optional[ArchivedEvent]:
+
+        if event.id in self:
+            return await self.get(event.id)
+
+        record = ArchivedEvent.from_event(event)
+
+        path = self.path
+        if path is None:
+            self._index(record, None)
+            return record
+
+        def _append() -> int:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "ab") as file:
+                offset = file.tell()
+                file.write(json.dumps(record.to_dict()).encode("utf-8") + b"\n")
+            return offset
+
+        try:
+            offset = await asyncio.to_thread(_append)
+        except OSError as e:
+            log.error(self.guild, f"Error writing to event archive {path}: {e.args}")
+            return
+
+        self._index(record, offset)
+        return record
+
+################################################################################
+    async def _read(self, event_ids: List[int]) -> List[ArchivedEvent]:
+
+        records = [self._records[i] for i in event_ids if i in self._records]
+        offsets = [self._offsets[i] for i in event_ids if i in self._offsets]
+        if not offsets:
+            return records
+
+        path = self.path
+
+        def _read_at() -> List[ArchivedEvent]:
+            found = []
+            with open(path, "rb") as file:
+                for offset in offsets:
+                    file.seek(offset)
+                    found.append(ArchivedEvent.from_dict(json.loads(file.readline())))
+            return found
+
+        try:
+            return records + await asyncio.to_thread(_read_at)
+        except (OSError, ValueError) as e:
+            log.error(self.guild, f"Error reading event archive {path}: {e.args}")
+            return records
+
+################################################################################
+    async def get(self, event_id: int) -> Optional[ArchivedEvent]:
+
+        records = await self._read([int(event_id)])
+        return records[0] if records else None
+
+################################################################################
+    async def all_events(self) -> List[ArchivedEvent]:
+
+        return await self._read(list(self._records) + list(self._offsets))
+
+################################################################################
+    async def staff_history(self, staff_id: int) -> List[ArchivedEvent]:
+
+        return await self._read(self._by_staff.get(int(staff_id), []))
+
+################################################################################
+    def attendance_count(self, staff_id: int) -> int:
+
+        return len(self._by_staff.get(int(staff_id), []))
+
+################################################################################
@@ -158,6 +158,8 @@ class EventDetails:
 
         self._start = value
         self.update()
+        self._parent.invalidate_coverage()
+        self._parent.register_deadlines()
 
 ################################################################################
     @property
@@ -170,6 +172,8 @@ class EventDetails:
 
         self._end = value
         self.update()
+        self._parent.invalidate_coverage()
+        self._parent.register_deadlines()
 
 ################################################################################
     @property
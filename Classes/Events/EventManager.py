@@ -6,9 +6,12 @@ from typing import TYPE_CHECKING, Any, List, Dict, Optional, Union
 from discord import Interaction, User, Embed, TextChannel, ForumChannel, ChannelType, NotFound
 
 from Classes.Common import ObjectManager, LazyChannel
+from Errors import InvalidNumber
 from .Event import Event
+from .EventArchive import EventArchive, ArchivedEvent
 
 from Utilities import Utilities as U
+from Utilities.Constants import EVENT_ARCHIVE_DELAY_HOURS
 from UI.Events import (
     EventManagerStatusView,
     EventListFrogginator
@@ -17,7 +20,7 @@ from logger import log
 from UI.Common import BasicTextModal, InstructionsInfo, ConfirmCancelView
 
 if TYPE_CHECKING:
-    from Classes import GuildData, Position
+    from Classes import GuildData, Position, StaffMember
     from UI.Common import FroggeView
 ################################################################################
 
@@ -30,6 +33,7 @@ class EventManager(ObjectManager):
         "_lockout",
         "_templates",
         "_channel",
+        "_archive",
     )
 
 ################################################################################
@@ -39,16 +43,30 @@ class EventManager(ObjectManager):
 
         self._lockout: int = 0
         self._channel: LazyChannel = LazyChannel(self, None)
+        self._archive: EventArchive = EventArchive(self)
 
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
 
         self._lockout = payload["event_lockout"]
-        self._managed = [Event.load(self, e) for e in payload["events"]]
         self._channel = LazyChannel(self, payload["channel_id"])
 
+        # Events that were already archived never get hydrated; newly-ended ones
+        # are archived on the way in so they don't linger in the hot list.
+        await self._archive.load()
+        self._managed = []
+        for data in payload["events"]:
+            if data["id"] in self._archive:
+                continue
+            event = Event.load(self, data)
+            if event.is_archivable:
+                await self._archive.add(event)
+                continue
+            self._managed.append(event)
+
         for event in self._managed:
             await event.update_post_components()
+            event.register_deadlines()
 
 ################################################################################
     @property
@@ -56,6 +74,12 @@ class EventManager(ObjectManager):
 
         return self._managed  # type: ignore
 
+################################################################################
+    @property
+    def archive(self) -> EventArchive:
+
+        return self._archive
+
 ################################################################################
     @property
     def lockout_threshold(self) -> int:
@@ -68,6 +92,9 @@ class EventManager(ObjectManager):
         self._lockout = value
         self.update()
 
+        for event in self.events:
+            event.register_deadlines()
+
 ################################################################################
     @property
     def templates(self) -> List[Event]:
@@ -93,7 +120,7 @@ class EventManager(ObjectManager):
         for event in self.events:
             if not (event.start_time or event.end_time):
                 continue
-            if event.start_time - timedelta(minutes=30) <= now <= event.end_time + timedelta(hours=8):
+            if event.start_time - timedelta(minutes=30) <= now <= event.end_time + timedelta(hours=EVENT_ARCHIVE_DELAY_HOURS):
                 return event
 
 ################################################################################
@@ -123,7 +150,8 @@ class EventManager(ObjectManager):
                 f"{'`Not Set`' if channel is None else channel.mention}\n\n"
 
                 f"**[`{len(self.events)}`]** events are currently scheduled.\n"
-                f"**[`{len(self.templates)}`]** event templates are available.\n\n"
+                f"**[`{len(self.templates)}`]** event templates are available.\n"
+                f"**[`{len(self.archive)}`]** past events are archived.\n\n"
 
                 "Please select a button below to add or modify events."
             )
@@ -298,7 +326,15 @@ class EventManager(ObjectManager):
             log.debug(self.guild, "Schedule Lockout Modal Cancelled")
             return
 
-        self.lockout_threshold = modal.value
+        try:
+            lockout = int(modal.value)
+        except ValueError:
+            log.warning(self.guild, f"Invalid number '{modal.value}'.")
+            error = InvalidNumber(modal.value)
+            await interaction.respond(embed=error, ephemeral=True)
+            return
+
+        self.lockout_threshold = lockout
 
         log.info(self.guild, f"Schedule Lockout Threshold Set: {modal.value} min.")
 
@@ -354,10 +390,30 @@ class EventManager(ObjectManager):
 
         new_event = Event.from_template(self, template)
         new_event.update()  # Call this so the event's datetimes are saved to the database
+        new_event.register_deadlines()
         self.events.append(new_event)
 
         await new_event.menu(interaction)
 
+################################################################################
+    async def archive_event(self, event: Event) -> None:
+
+        if event not in self._managed:
+            return
+
+        if await self._archive.add(event) is None:
+            return
+
+        event.cancel_deadlines()
+        self._managed.remove(event)
+
+        log.info(self.guild, f"Event Archived: {event.name} ({event.id})")
+
+################################################################################
+    async def staff_history(self, staff: StaffMember) -> List[ArchivedEvent]:
+
+        return await self._archive.staff_history(staff.id)
+
 ################################################################################
     async def remove_position(self, position: Position) -> None:
 
@@ -181,6 +181,15 @@ class EventPosition(Identifiable):
 ################################################################################
     async def toggle_user_signup(self, interaction: Interaction) -> None:
 
+        if self.parent.is_locked_out:
+            error = U.make_error(
+                title="Signups Locked",
+                message="Signups for this event have closed.",
+                solution="Please contact a member of the staff team for assistance."
+            )
+            await interaction.respond(embed=error, ephemeral=True)
+            return
+
         staff = self.parent.manager.guild.staff_manager[interaction.user.id]
         if staff is None:
             error = U.make_error(
@@ -202,10 +211,9 @@ class EventPosition(Identifiable):
 
         signups = [s for s in self.signups if s.staff_member == staff]
         if signups:
-            for signup in signups:
-                signup.delete()
-
             await interaction.respond("** **", delete_after=0.1)
+            await EventSignup.delete_many(signups)
+            self._parent.request_post_refresh()
             return
 
         options = [
@@ -238,10 +246,9 @@ class EventPosition(Identifiable):
             return
 
         shifts = [self.parent.get_bracket(bracket_id) for bracket_id in view.value]
-        for shift in shifts:
-            self.signups.append(EventSignup.new(self, staff, shift))
+        self.signups.extend(await EventSignup.new_many(self, staff, [s for s in shifts if s is not None]))
 
-        await self._parent.update_post_components()
+        self._parent.request_post_refresh()
 
 ################################################################################
     def _add_signup_from_data(self, data: Dict[str, Any]) -> None:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict
+from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, List
 from discord import SelectOption
 from Classes.Common import Identifiable
+from logger import log
 
 if TYPE_CHECKING:
     from Classes import EventPosition, StaffMember, ShiftBracket, FroggeBot
@@ -38,6 +39,26 @@ class EventSignup(Identifiable):
         data = parent.bot.api.create_event_signup(parent.id, staff.id, bracket.id)
         return cls(parent, _id=data["id"], staff=staff, bracket=bracket)
 
+################################################################################
+    @classmethod
+    async def new_many(
+        cls: Type[ES],
+        parent: EventPosition,
+        staff: StaffMember,
+        brackets: List[ShiftBracket]
+    ) -> List[ES]:
+
+        results = await parent.bot.api.create_event_signups(parent.id, staff.id, [b.id for b in brackets])
+
+        signups = []
+        for data, bracket in zip(results, brackets):
+            if not isinstance(data, dict) or "id" not in data:
+                log.error(parent.parent.guild, f"Failed to create signup for bracket {bracket.id}: {data!r}")
+                continue
+            signups.append(cls(parent, _id=data["id"], staff=staff, bracket=bracket))
+
+        return signups
+
 ################################################################################
     @classmethod
     def load(cls: Type[ES], parent: EventPosition, data: Dict[str, Any]) -> ES:
@@ -79,6 +100,20 @@ class EventSignup(Identifiable):
         self.bot.api.delete_event_signup(self.id)
         self.parent.signups.remove(self)
 
+################################################################################
+    @staticmethod
+    async def delete_many(signups: List[EventSignup]) -> None:
+
+        if not signups:
+            return
+
+        results = await signups[0].bot.api.delete_event_signups([s.id for s in signups])
+        for signup, result in zip(signups, results):
+            if isinstance(result, Exception):
+                log.error(signup.parent.parent.guild, f"Failed to delete signup {signup.id}: {result!r}")
+                continue
+            signup.parent.signups.remove(signup)
+
 ################################################################################
     def select_option(self) -> SelectOption:
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Type, TypeVar, Optional, Any, Dict, List
 from discord import Interaction, Embed, EmbedField, SelectOption
 
 from Classes.Common import Identifiable
+from .ShiftCoverage import ShiftCoverage
 from Enums import Timezone, Hours, Minutes
 from UI.Common import TimeSelectView, ConfirmCancelView
 from UI.Events import ShiftBracketStatusView
@@ -97,6 +98,7 @@ class ShiftBracket(Identifiable):
 
         self._start = value
         self.update()
+        self._parent.invalidate_coverage()
 
 ################################################################################
     @property
@@ -109,6 +111,7 @@ class ShiftBracket(Identifiable):
 
         self._end = value
         self.update()
+        self._parent.invalidate_coverage()
 
 ################################################################################
     @property
@@ -164,32 +167,16 @@ class ShiftBracket(Identifiable):
             self._parent._shifts.remove(self)
         except ValueError:
             pass
+        self._parent.invalidate_coverage()
 
 ################################################################################
     def overlaps_with(self, other: ShiftBracket) -> bool:
 
-        # Normalize the times to a duration from the start of the respective days
-        def normalize_time(dt: datetime) -> timedelta:
-            return timedelta(hours=dt.hour, minutes=dt.minute)
-
-        self_start_duration = normalize_time(self.start_time)
-        self_end_duration = normalize_time(self.end_time)
-        other_start_duration = normalize_time(other.start_time)
-        other_end_duration = normalize_time(other.end_time)
-
-        # Handle shifts that end after midnight
-        if self_end_duration < self_start_duration:
-            self_end_duration += timedelta(days=1)
-        if other_end_duration < other_start_duration:
-            other_end_duration += timedelta(days=1)
-
-        # Normalize the start and end durations to the same day
-        self_start = self.start_time.replace(hour=0, minute=0, second=0, microsecond=0) + self_start_duration
-        self_end = self.start_time.replace(hour=0, minute=0, second=0, microsecond=0) + self_end_duration
-        other_start = other.start_time.replace(hour=0, minute=0, second=0, microsecond=0) + other_start_duration
-        other_end = other.start_time.replace(hour=0, minute=0, second=0, microsecond=0) + other_end_duration
-
-        return self_start < other_end and self_end > other_start
+        # Measure both brackets on this bracket's own timeline so the midnight
+        # wrap is handled the same way as the event coverage sweep.
+        return ShiftCoverage(self.start_time, self.end_time, [self]).conflicts_with(
+            other.start_time, other.end_time
+        )
 
 ################################################################################
     def status(self) -> Embed:
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from Classes import ShiftBracket
+################################################################################
+
+__all__ = ("ShiftCoverage", )
+
+Interval = Tuple[int, int]
+
+################################################################################
+class ShiftCoverage:
+    """Interval-union view of an event's shift brackets."""
+
+    __slots__ = (
+        "_start",
+        "_duration",
+        "_merged",
+        "_starts",
+        "_gaps",
+        "_overlaps",
+    )
+
+    DAY_MINUTES = 24 * 60
+
+################################################################################
+    def __init__(self, start: datetime, end: datetime, brackets: List[ShiftBracket]) -> None:
+
+        self._start: datetime = start
+        self._duration: int = self._span(start, end)
+
+        self._merged: List[Interval] = []
+        self._starts: List[int] = []
+        self._gaps: List[Interval] = []
+        self._overlaps: List[Interval] = []
+
+        intervals = sorted(self.normalize(b.start_time, b.end_time) for b in brackets)
+        self._sweep(intervals)
+
+################################################################################
+    @classmethod
+    def _span(cls, start: datetime, end: datetime) -> int:
+
+        minutes = int((end - start).total_seconds() // 60)
+        # Times that cross midnight may have been saved against the same date.
+        if minutes < 0:
+            minutes += cls.DAY_MINUTES
+        return minutes
+
+################################################################################
+    def normalize(self, start: datetime, end: datetime) -> Interval:
+
+        # Brackets copied from templates can carry stale dates, so only the
+        # time-of-day distance from the event start is meaningful.
+        offset = int((start - self._start).total_seconds() // 60) % self.DAY_MINUTES
+        if offset > self._duration:
+            # Starts before the event does (ie. earlier in the same hour).
+            offset -= self.DAY_MINUTES
+
+        return offset, offset + self._span(start, end)
+
+################################################################################
+    def _sweep(self, intervals: List[Interval]) -> None:
+
+        for start, end in intervals:
+            if self._merged and start < self._merged[-1][1]:
+                self._overlaps.append((start, min(end, self._merged[-1][1])))
+            if self._merged and start <= self._merged[-1][1]:
+                last_start, last_end = self._merged[-1]
+                self._merged[-1] = (last_start, max(last_end, end))
+            else:
+                self._merged.append((start, end))
+
+        self._starts = [start for start, _ in self._merged]
+
+        cursor = 0
+        for start, end in self._merged:
+            if start > cursor and cursor < self._duration:
+                self._gaps.append((cursor, min(start, self._duration)))
+            cursor = max(cursor, end)
+        if cursor < self._duration:
+            self._gaps.append((cursor, self._duration))
+
+################################################################################
+    def _to_datetimes(self, intervals: List[Interval]) -> List[Tuple[datetime, datetime]]:
+
+        return [
+            (self._start + timedelta(minutes=start), self._start + timedelta(minutes=end))
+            for start, end in intervals
+        ]
+
+################################################################################
+    @property
+    def is_fully_covered(self) -> bool:
+
+        return not self._gaps
+
+################################################################################
+    @property
+    def gaps(self) -> List[Tuple[datetime, datetime]]:
+
+        return self._to_datetimes(self._gaps)
+
+################################################################################
+    @property
+    def overlaps(self) -> List[Tuple[datetime, datetime]]:
+
+        return self._to_datetimes(self._overlaps)
+
+################################################################################
+    @property
+    def covered(self) -> List[Tuple[datetime, datetime]]:
+
+        return self._to_datetimes(self._merged)
+
+################################################################################
+    def conflicts_with(self, start: datetime, end: datetime) -> bool:
+
+        new_start, new_end = self.normalize(start, end)
+
+        # Merged intervals are disjoint, so only the neighbours around the
+        # insertion point can possibly intersect.
+        idx = bisect_right(self._starts, new_start) - 1
+        if idx >= 0 and self._merged[idx][1] > new_start:
+            return True
+        if idx + 1 < len(self._merged) and self._merged[idx + 1][0] < new_end:
+            return True
+
+        return False
+
+################################################################################
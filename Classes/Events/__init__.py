@@ -1,8 +1,10 @@
 from .EventManager import EventManager
+from .EventArchive import EventArchive, ArchivedEvent
 from .Event import Event
 from .EventDetails import EventDetails
 from .EventElement import EventElement
 from .EventPosition import EventPosition
 from .ShiftBracket import ShiftBracket
+from .ShiftCoverage import ShiftCoverage
 from .EventSignup import EventSignup
 ################################################################################
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, UTC
-from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, Optional
+import random
+from datetime import datetime, timedelta, UTC
+from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, List, Optional
 
 from discord import (
     User,
@@ -18,13 +19,20 @@ from discord.ext.pages import Page
 
 from Assets import BotEmojis
 from Classes.Activities import BaseActivity
-from Classes.Common import LazyMessage
+from Classes.Common import LazyMessage, PostRefresher
 from Errors import ChannelNotSet, ChannelMissing, InsufficientPermissions
 from UI.Common import ConfirmCancelView
 from UI.Giveaways import GiveawayStatusView, GiveawaySignupView
 from Utilities import Utilities as U, FroggeColor
+from Utilities.Constants import (
+    ACTIVITY_POST_REFRESH_SECONDS,
+    ACTIVITY_POST_MIN_INTERVAL_SECONDS,
+    GIVEAWAY_AUTO_ROLL_GRACE_HOURS,
+)
+from logger import log
 from .GiveawayDetails import GiveawayDetails
 from .GiveawayEntry import GiveawayEntry
+from .GiveawayEntryIntake import GiveawayEntryIntake
 
 if TYPE_CHECKING:
     from Classes import GiveawayManager
@@ -36,10 +44,13 @@ __all__ = ("Giveaway", )
 G = TypeVar("G", bound="Giveaway")
 
 ################################################################################
-class Giveaway(BaseActivity):
+class Giveaway(BaseActivity, PostRefresher):
 
     __slots__ = (
         "_post_msg",
+        "_refresher",
+        "_intake",
+        "_closed",
     )
 
 ################################################################################
@@ -52,6 +63,11 @@ class Giveaway(BaseActivity):
         super().__init__(mgr, _id, details, entries, winners)
 
         self._post_msg: LazyMessage = LazyMessage(self, kwargs.get("post_url"))
+        self._init_refresher(ACTIVITY_POST_REFRESH_SECONDS, ACTIVITY_POST_MIN_INTERVAL_SECONDS)
+        self._intake: GiveawayEntryIntake = GiveawayEntryIntake(self)
+        self._intake.load(self._entries)
+        # Ended with nobody to draw; not persisted, so re-derived on load.
+        self._closed: bool = False
 
 ################################################################################
     @classmethod
@@ -74,6 +90,10 @@ class Giveaway(BaseActivity):
         self._winners = [e for e in self._entries if e.id in data["winners"]]
 
         self._post_msg = LazyMessage(self, data["post_url"])
+        self._init_refresher(ACTIVITY_POST_REFRESH_SECONDS, ACTIVITY_POST_MIN_INTERVAL_SECONDS)
+        self._intake = GiveawayEntryIntake(self)
+        self._intake.load(self._entries)
+        self._closed = False
 
         return self
 
@@ -127,7 +147,7 @@ class Giveaway(BaseActivity):
 ################################################################################
     def is_active(self) -> bool:
 
-        return len(self.winners) == 0
+        return len(self.winners) == 0 and not self._closed
 
 ################################################################################
     def update(self) -> None:
@@ -145,6 +165,7 @@ class Giveaway(BaseActivity):
 ################################################################################
     def delete(self) -> None:
 
+        self.cancel_deadline()
         self.bot.api.delete_giveaway(self.id)
         self._mgr._managed.remove(self)
 
@@ -337,7 +358,7 @@ class Giveaway(BaseActivity):
 ################################################################################
     async def update_post_components(self, force: bool = False) -> bool:
 
-        if self.winners and not force:
+        if not self.is_active() and not force:
             return True
 
         if await self.post_message is None:
@@ -377,28 +398,112 @@ class Giveaway(BaseActivity):
             if not view.complete or view.value is False:
                 return
 
+        # Winners are saved by entry ID, so everything queued must be written first.
+        await self._intake.settle()
+
         await super().determine_winners(interaction)
         await self.guild.log.activity_rolled(self, interaction.user)
 
+        self.cancel_deadline()
+        self._refresher.cancel()
         await self.update_post_components(force=True)
         await interaction.respond("** **", delete_after=0.1)
 
 ################################################################################
-    async def signup(self, interaction: Interaction) -> None:
+    def _draw_winners(self) -> List[GiveawayEntry]:  # type: ignore
+
+        # Entries that still couldn't be saved have no ID to record a win against.
+        saved = [e for e in self._entries if e.id is not None]
+        if excluded := len(self._entries) - len(saved):
+            log.warning(
+                self.guild,
+                f"Giveaway {self.name} ({self.id}): {excluded} unsaved entries "
+                f"excluded from the draw."
+            )
+
+        return random.sample(saved, min(self.num_winners, len(saved)))
+
+################################################################################
+    def register_deadline(self) -> None:
+
+        self.cancel_deadline()
+
+        if self.winners or self.end_date is None:
+            return
+
+        end_date = U.ensure_timezone(self.end_date, self.timezone)
+
+        # Nobody entered and it's already over, so it was closed (and logged)
+        # before the restart; just mark it again rather than re-running it.
+        self._closed = not self._entries and end_date <= datetime.now(UTC)
+        if self._closed:
+            return
+
+        # An end date that passed while offline rolls as soon as it's registered,
+        # unless it's so stale that winners would be surprised to hear from us.
+        if end_date < datetime.now(UTC) - timedelta(hours=GIVEAWAY_AUTO_ROLL_GRACE_HOURS):
+            log.info(
+                self.guild,
+                f"Giveaway {self.name} ({self.id}) ended more than "
+                f"{GIVEAWAY_AUTO_ROLL_GRACE_HOURS} hours ago; not auto-rolling it."
+            )
+            return
+
+        self.bot.scheduler.schedule(("giveaway_roll", self.id), end_date, self.auto_roll)
+
+################################################################################
+    def cancel_deadline(self) -> None:
+
+        self.bot.scheduler.cancel(("giveaway_roll", self.id))
+
+################################################################################
+    async def auto_roll(self) -> None:
 
         if self.winners:
+            return
+
+        await self._intake.settle()
+        if not self._entries:
+            await self.close()
+            return
+
+        log.info(self.guild, f"Auto-rolling giveaway {self.name} ({self.id}).")
+
+        self.winners = self._draw_winners()
+        await self.guild.log.activity_rolled(self, None)
+
+        self._refresher.cancel()
+        await self.update_post_components(force=True)
+
+        if self.auto_notify:
+            await self.notify_winners()
+
+################################################################################
+    async def close(self) -> None:
+
+        log.info(self.guild, f"Giveaway {self.name} ({self.id}) ended with no entries.")
+
+        self._closed = True
+        self._refresher.cancel()
+        await self.update_post_components(force=True)
+        await self.guild.log.activity_closed(self)
+
+################################################################################
+    async def signup(self, interaction: Interaction) -> None:
+
+        if not self.is_active():
             await interaction.respond("The giveaway has already ended.", ephemeral=True)
             return
 
-        if entry := self.get_entry_by_user(interaction.user.id):
-            entry.delete()
+        # Entries are acknowledged right away and persisted in the next batch.
+        if interaction.user.id in self._intake:
+            self._intake.withdraw(interaction.user.id)
             confirm = U.make_embed(
                 title="__Giveaway Entry Removed__",
                 description="You have successfully removed your entry."
             )
         else:
-            new_entry = GiveawayEntry.new(self, interaction.user)
-            self._entries.append(new_entry)
+            self._intake.enter(interaction.user.id)
             confirm = U.make_embed(
                 title="__Giveaway Entry Added__",
                 description="You have successfully entered the giveaway."
@@ -409,7 +514,7 @@ class Giveaway(BaseActivity):
 ################################################################################
     def get_entry_by_user(self, user_id: int) -> Optional[GiveawayEntry]:
 
-        return next((e for e in self.entries if e._user.id == int(user_id)), None)
+        return self._intake.get(user_id)
 
 ################################################################################
     async def page(self) -> Page:
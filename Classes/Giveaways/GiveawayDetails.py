@@ -103,6 +103,7 @@ class GiveawayDetails(ActivityDetails):
 
         self._end_time = value
         self.update()
+        self._parent.register_deadline()
 
 ################################################################################
     @property
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type, Tuple, Any, TypeVar, Dict
 
-from discord import User, NotFound, Forbidden
+from discord import Embed, User
 
 from Classes.Activities import ActivityEntry
 from Utilities import Utilities as U
@@ -51,9 +51,9 @@ class GiveawayEntry(ActivityEntry):
         self._parent.entries.remove(self)
 
 ################################################################################
-    async def notify(self) -> bool:
+    def win_embed(self) -> Embed:
 
-        embed = U.make_embed(
+        return U.make_embed(
             title=f"__YOU WON!__",
             description=(
                 f"You have won the giveaway `{self._parent.name}` for the prize of "
@@ -63,17 +63,9 @@ class GiveawayEntry(ActivityEntry):
             ),
         )
 
-        user = await self.user
-        try:
-            await user.send(embed=embed)
-        except NotFound:
-            await self._parent.guild.log.user_not_found(user)
-            return False
-        except Forbidden:
-            await self._parent.guild.log.dms_closed(await self.user)
-            return False
-        else:
-            await self._parent.guild.log.giveaway_winner_notified(self)
-            return True
+################################################################################
+    async def log_notified(self) -> None:
+
+        await self._parent.guild.log.giveaway_winner_notified(self)
 
 ################################################################################
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from Classes.Common import RefreshDebouncer
+from Utilities.Constants import GIVEAWAY_ENTRY_FLUSH_SECONDS, GIVEAWAY_ENTRY_MAX_ATTEMPTS
+from logger import log
+from .GiveawayEntry import GiveawayEntry
+
+if TYPE_CHECKING:
+    from Classes import Giveaway, GuildData
+################################################################################
+
+__all__ = ("GiveawayEntryIntake", )
+
+################################################################################
+class GiveawayEntryIntake:
+    """Accepts giveaway entries in memory and persists them in micro-batches."""
+
+    __slots__ = (
+        "_parent",
+        "_entrants",
+        "_pending_adds",
+        "_pending_removals",
+        "_attempts",
+        "_flusher",
+        "_lock",
+    )
+
+################################################################################
+    def __init__(self, parent: Giveaway) -> None:
+
+        self._parent: Giveaway = parent
+
+        self._entrants: Dict[int, GiveawayEntry] = {}
+        self._pending_adds: Dict[int, GiveawayEntry] = {}
+        self._pending_removals: List[GiveawayEntry] = []
+        # ("add", user_id) / ("remove", entry_id) -> failed attempts so far
+        self._attempts: Dict[Tuple[str, int], int] = {}
+
+        self._flusher: RefreshDebouncer = RefreshDebouncer(self.flush, GIVEAWAY_ENTRY_FLUSH_SECONDS)
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+################################################################################
+    def __contains__(self, user_id: int) -> bool:
+
+        return int(user_id) in self._entrants
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._entrants)
+
+################################################################################
+    @property
+    def guild(self) -> GuildData:
+
+        return self._parent.guild
+
+################################################################################
+    @property
+    def has_pending(self) -> bool:
+
+        return bool(self._pending_adds or self._pending_removals)
+
+################################################################################
+    def load(self, entries: List[GiveawayEntry]) -> None:
+
+        self._entrants = {e._user.id: e for e in entries}
+
+################################################################################
+    def get(self, user_id: int) -> Optional[GiveawayEntry]:
+
+        return self._entrants.get(int(user_id))
+
+################################################################################
+    def enter(self, user_id: int) -> GiveawayEntry:
+
+        if entry := self.get(user_id):
+            return entry
+
+        # The entry gets its ID once its batch has been written.
+        entry = GiveawayEntry(self._parent, None, user_id)  # type: ignore
+
+        self._entrants[user_id] = entry
+        self._pending_adds[user_id] = entry
+        self._parent.entries.append(entry)
+
+        self._flusher.request()
+        return entry
+
+################################################################################
+    def _detach(self, user_id: int) -> Optional[GiveawayEntry]:
+
+        entry = self._entrants.pop(int(user_id), None)
+        if entry is None:
+            return
+
+        # Pending entries all compare equal (no ID yet), so match on identity.
+        entries = self._parent.entries
+        index = next((i for i, e in enumerate(entries) if e is entry), None)
+        if index is not None:
+            del entries[index]
+
+        return entry
+
+################################################################################
+    def withdraw(self, user_id: int) -> None:
+
+        entry = self._detach(user_id)
+        if entry is None:
+            return
+
+        # Never written, so there's nothing to delete.
+        if self._pending_adds.pop(entry._user.id, None) is not None:
+            self._attempts.pop(("add", entry._user.id), None)
+            return
+
+        self._pending_removals.append(entry)
+        self._flusher.request()
+
+################################################################################
+    async def settle(self) -> None:
+
+        # Failed items use up an attempt on every pass, so this always ends.
+        for _ in range(GIVEAWAY_ENTRY_MAX_ATTEMPTS):
+            await self.flush()
+            if not self.has_pending:
+                return
+
+################################################################################
+    def _should_retry(self, key: Tuple[str, int], error: Exception) -> bool:
+
+        attempts = self._attempts[key] = self._attempts.get(key, 0) + 1
+        if attempts < GIVEAWAY_ENTRY_MAX_ATTEMPTS:
+            return True
+
+        del self._attempts[key]
+        log.error(
+            self.guild,
+            f"Giving up on giveaway entry {key[0]} for {key[1]} after "
+            f"{attempts} attempts: {error!r}"
+        )
+        return False
+
+################################################################################
+    async def flush(self) -> None:
+
+        self._flusher.cancel()
+
+        async with self._lock:
+            adds = list(self._pending_adds.values())
+            self._pending_adds.clear()
+            # Withdrawals of entries still being created wait for the next batch.
+            removals = [e for e in self._pending_removals if e.id is not None]
+            self._pending_removals = [e for e in self._pending_removals if e.id is None]
+
+            api = self._parent.bot.api
+            saved = removed = 0
+
+            if adds:
+                results = await api.create_giveaway_entries(
+                    self._parent.id, [e._user.id for e in adds]
+                )
+                failed = []
+                for entry, data in zip(adds, results):
+                    key = ("add", entry._user.id)
+                    if isinstance(data, dict) and "id" in data:
+                        entry._id = data["id"]
+                        self._attempts.pop(key, None)
+                        saved += 1
+                        continue
+
+                    failed.append(entry)
+                    error = data if isinstance(data, Exception) else ValueError(data)
+                    # Only retry entries that haven't been withdrawn meanwhile.
+                    if self._entrants.get(entry._user.id) is entry:
+                        if self._should_retry(key, error):
+                            self._pending_adds[entry._user.id] = entry
+                        else:
+                            # Never saved, so let the user enter again.
+                            self._detach(entry._user.id)
+                    else:
+                        self._attempts.pop(key, None)
+
+                # Withdrawals of entries that were never created have nothing to delete.
+                if failed:
+                    self._pending_removals = [
+                        e for e in self._pending_removals
+                        if not any(e is f for f in failed)
+                    ]
+
+            if removals:
+                results = await api.delete_giveaway_entries([e.id for e in removals])
+                for entry, result in zip(removals, results):
+                    key = ("remove", entry.id)
+                    if not isinstance(result, Exception):
+                        self._attempts.pop(key, None)
+                        removed += 1
+                    elif self._should_retry(key, result):
+                        self._pending_removals.append(entry)
+
+            if adds or removals:
+                log.info(
+                    self.guild,
+                    f"Giveaway {self._parent.id}: saved {saved}/{len(adds)} entries, "
+                    f"removed {removed}/{len(removals)}."
+                )
+
+        if self.has_pending:
+            self._flusher.request()
+
+################################################################################
@@ -30,6 +30,9 @@ class GiveawayManager(ActivityManager):
         self._managed = [Giveaway.load(self, g) for g in payload["giveaways"]]
         self._channel = LazyChannel(self, payload["channel_id"])
 
+        for giveaway in self._managed:
+            giveaway.register_deadline()  # type: ignore
+
 ################################################################################
     async def status(self) -> Embed:
 
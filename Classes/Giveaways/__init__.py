@@ -2,4 +2,5 @@ from .GiveawayManager import GiveawayManager
 from .Giveaway import Giveaway
 from .GiveawayDetails import GiveawayDetails
 from .GiveawayEntry import GiveawayEntry
+from .GiveawayEntryIntake import GiveawayEntryIntake
 ###############################################################################
@@ -9,7 +9,6 @@ from discord import (
     Colour,
     EmbedField,
     TextChannel,
-    Thread,
     SelectOption,
     Forbidden,
     NotFound,
@@ -330,23 +329,23 @@ class Profile(ManagedObject):
             return
         
         # Must be a forum channel
-        matching_thread = next(
-            (t for t in channel.threads if t.name.lower() == self.name.lower()),  # type: ignore
-            None
-        )
-        if matching_thread:
-            async for m in matching_thread.history():
-                await m.delete()
-            action = matching_thread.send  # type: ignore
-        else:
-            action = lambda **kw: channel.create_thread(name=self.name, **kw)  # type: ignore
-        
+        thread_index = self._mgr.guild.thread_index
+        matching_thread = await thread_index.get(channel, self.name)  # type: ignore
+
         try:
-            result = await action(embeds=post_embeds)
-            if isinstance(result, Thread):
-                post_msg = await result.fetch_message(result.last_message_id)
+            if matching_thread is not None:
+                # Re-posting reuses the existing thread's starter message, as
+                # long as it's ours to edit.
+                starter = await thread_index.own_starter_message(matching_thread)
+                if starter is not None:
+                    await starter.edit(embeds=post_embeds)
+                    post_msg = starter
+                else:
+                    post_msg = await matching_thread.send(embeds=post_embeds)
             else:
-                post_msg = result
+                result = await channel.create_thread(name=self.name, embeds=post_embeds)  # type: ignore
+                thread_index.register(result)
+                post_msg = await thread_index.starter_message(result)
             self._post_msg.set(post_msg)
             self.update()
             await interaction.respond(embed=self.success_message())
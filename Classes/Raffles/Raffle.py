@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, Optional
+from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, List, Optional
 
-from discord import User, Embed, EmbedField, Interaction, File, Message, NotFound, ChannelType, Forbidden
+from discord import User, Embed, EmbedField, Interaction, Message, NotFound, ChannelType, Forbidden, SelectOption
 
-from Classes.Common import LazyMessage
+from Classes.Common import LazyMessage, PostRefresher
 from Classes.Activities import BaseActivity
 from .RaffleDetails import RaffleDetails
 from .RaffleEntry import RaffleEntry
+from .TicketPool import TicketPool
 from Utilities import Utilities as U
 from Assets import BotEmojis
 from UI.Raffles import RaffleStatusView
 from Errors import NoEntries, ChannelMissing, InsufficientPermissions
-from UI.Common import ConfirmCancelView
+from UI.Common import ConfirmCancelView, FroggeSelectView
+from Utilities.Constants import ACTIVITY_POST_REFRESH_SECONDS, ACTIVITY_POST_MIN_INTERVAL_SECONDS
 
 if TYPE_CHECKING:
     from Classes import RaffleManager
@@ -25,11 +26,14 @@ __all__ = ("Raffle", )
 R = TypeVar("R", bound="Raffle")
 
 ################################################################################
-class Raffle(BaseActivity):
+class Raffle(BaseActivity, PostRefresher):
 
     __slots__ = (
         "_active",
         "_post_msg",
+        "_by_user",
+        "_tickets",
+        "_refresher",
     )
 
 ################################################################################
@@ -44,6 +48,12 @@ class Raffle(BaseActivity):
         self._active = kwargs.get("is_active", False)
         self._post_msg = LazyMessage(self, kwargs.get("post_url"))
 
+        self._by_user: Dict[int, RaffleEntry] = {}
+        self._tickets: int = 0
+        self._index_entries()
+
+        self._init_refresher(ACTIVITY_POST_REFRESH_SECONDS, ACTIVITY_POST_MIN_INTERVAL_SECONDS)
+
 ################################################################################
     @classmethod
     def new(cls: Type[R], mgr: RaffleManager) -> R:
@@ -69,8 +79,30 @@ class Raffle(BaseActivity):
         self._active = data["is_active"]
         self._post_msg = LazyMessage(self, data["post_url"])
 
+        self._by_user = {}
+        self._tickets = 0
+        self._index_entries()
+
+        self._init_refresher(ACTIVITY_POST_REFRESH_SECONDS, ACTIVITY_POST_MIN_INTERVAL_SECONDS)
+
         return self
 
+################################################################################
+    def __getitem__(self, user_id: int) -> Optional[RaffleEntry]:
+
+        return self._by_user.get(int(user_id))
+
+################################################################################
+    def _index_entries(self) -> None:
+
+        self._by_user = {e._user.id: e for e in self._entries}
+        self._tickets = sum(e.quantity for e in self._entries)
+
+################################################################################
+    def tally_tickets(self, delta: int) -> None:
+
+        self._tickets += delta
+
 ################################################################################
     @property
     def cost(self) -> int:
@@ -81,7 +113,7 @@ class Raffle(BaseActivity):
     @property
     def total_tickets(self) -> int:
 
-        return sum(e.quantity for e in self._entries)
+        return self._tickets
 
 ################################################################################
     @property
@@ -216,9 +248,16 @@ class Raffle(BaseActivity):
         await super().determine_winners(interaction)
         await self.guild.log.activity_rolled(self, interaction.user)
 
-        await self.update_post_components()
+        await self._refresher.flush()
         await interaction.respond("** **", delete_after=0.1)
 
+################################################################################
+    def _draw_winners(self) -> List[RaffleEntry]:
+
+        # Each ticket is one chance to win, but an entry can only win once.
+        pool = TicketPool(self._entries, [e.quantity for e in self._entries])
+        return pool.sample(self.num_winners)
+
 ################################################################################
     async def set_cost(self, interaction: Interaction) -> None:
 
@@ -270,8 +309,10 @@ class Raffle(BaseActivity):
         else:
             entry = RaffleEntry.new(self, user.id, qty)
             self._entries.append(entry)
+            self._by_user[user.id] = entry
+            self.tally_tickets(qty)
 
-        await self.update_post_components()
+        self.request_post_refresh()
 
         confirm = U.make_embed(
             title="__Tickets Added__",
@@ -285,12 +326,22 @@ class Raffle(BaseActivity):
 ################################################################################
     async def entries_report(self, interaction: Interaction) -> None:
 
-        entry_data = await self.generate_entries_report_str()
-        filename = f"{self.name or 'Unnamed Raffle'} Entries - {datetime.now().strftime('%m-%d-%y')}.txt"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(entry_data)
+        prompt = U.make_embed(
+            title="__Entries Report__",
+            description="Select the format you would like the entries report in."
+        )
+        view = FroggeSelectView(
+            interaction.user,
+            [SelectOption(label=fmt.upper(), value=fmt, default=fmt == "txt") for fmt in self.REPORT_FORMATS]
+        )
+
+        await interaction.respond(embed=prompt, view=view)
+        await view.wait()
+
+        if not view.complete or view.value is False:
+            return
 
-        await interaction.respond(file=File(filename))
+        await interaction.respond(file=await self.export_entries(view.value))
 
 ################################################################################
     async def post_tracker(self, interaction: Interaction) -> None:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type, Tuple, Any, TypeVar, Dict
 
-from discord import User, Forbidden, NotFound, Interaction
+from discord import Embed, Interaction
 
 from Classes.Activities import ActivityEntry
 from Utilities.Constants import *
@@ -59,9 +59,9 @@ class RaffleEntry(ActivityEntry):
         self.bot.api.delete_raffle_entry(self.id)
 
 ################################################################################
-    async def notify(self) -> bool:
+    def win_embed(self) -> Embed:
 
-        embed = U.make_embed(
+        return U.make_embed(
             title=f"__YOU WON!__",
             description=(
                 f"Congratulations! You have won the raffle for **{self._parent.prize}**! "
@@ -71,18 +71,10 @@ class RaffleEntry(ActivityEntry):
             ),
         )
 
-        user = await self.user
-        try:
-            await user.send(embed=embed)
-        except NotFound:
-            await self._parent.guild.log.user_not_found(user)
-            return False
-        except Forbidden:
-            await self._parent.guild.log.dms_closed(user)
-            return False
-        else:
-            await self._parent.guild.log.raffle_winner_notified(self)
-            return True
+################################################################################
+    async def log_notified(self) -> None:
+
+        await self._parent.guild.log.raffle_winner_notified(self)
 
 ################################################################################
     async def add_tickets(self, interaction: Interaction, qty: int) -> None:
@@ -98,5 +90,6 @@ class RaffleEntry(ActivityEntry):
             return
 
         self.quantity += qty
+        self._parent.tally_tickets(qty)
 
 ################################################################################
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+################################################################################
+
+__all__ = ("TicketPool", )
+
+T = TypeVar("T")
+
+################################################################################
+class TicketPool(Generic[T]):
+    """Weighted sampling without replacement over ticket counts."""
+
+    __slots__ = (
+        "_items",
+        "_weights",
+        "_tree",
+        "_total",
+        "_rng",
+    )
+
+################################################################################
+    def __init__(self, items: Sequence[T], weights: Sequence[int], rng: Optional[random.Random] = None) -> None:
+
+        self._items: List[T] = list(items)
+        self._weights: List[int] = [max(int(w), 0) for w in weights]
+        self._rng: random.Random = rng or random.SystemRandom()
+
+        # Linear-time build: push each node's sum up to its parent once.
+        size = len(self._weights)
+        self._tree: List[int] = [0] + self._weights
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self._tree[parent] += self._tree[i]
+
+        self._total: int = sum(self._weights)
+
+################################################################################
+    def __len__(self) -> int:
+
+        return self._total
+
+################################################################################
+    def _add(self, idx: int, delta: int) -> None:
+
+        i = idx + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+################################################################################
+    def _find(self, ticket: int) -> int:
+
+        # Descend the tree to the first index whose cumulative total exceeds
+        # the ticket number.
+        pos = 0
+        step = 1 << (len(self._weights).bit_length())
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= ticket:
+                pos = nxt
+                ticket -= self._tree[nxt]
+            step >>= 1
+
+        return pos
+
+################################################################################
+    def draw(self) -> T:
+
+        if self._total <= 0:
+            raise ValueError("No tickets left in the pool.")
+
+        idx = self._find(self._rng.randrange(self._total))
+        weight = self._weights[idx]
+
+        self._weights[idx] = 0
+        self._add(idx, -weight)
+        self._total -= weight
+
+        return self._items[idx]
+
+################################################################################
+    def sample(self, k: int) -> List[T]:
+
+        k = min(k, sum(1 for w in self._weights if w > 0))
+        return [self.draw() for _ in range(k)]
+
+################################################################################
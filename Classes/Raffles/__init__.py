@@ -2,4 +2,5 @@ from .Raffle import Raffle
 from .RaffleManager import RaffleManager
 from .RaffleEntry import RaffleEntry
 from .RaffleDetails import RaffleDetails
+from .TicketPool import TicketPool
 ################################################################################
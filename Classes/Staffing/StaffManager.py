@@ -9,7 +9,7 @@ from UI.Common import ConfirmCancelView, FroggeView, BasicTextModal
 from UI.Staffing import StaffingMainMenuView, EmployeeManagementMenuView
 from Utilities import Utilities as U
 from .StaffMember import StaffMember
-from Classes.Common import ObjectManager, LazyRole
+from Classes.Common import ObjectManager, LazyRole, RoleUpdate
 
 if TYPE_CHECKING:
     from Classes import GuildData, Character, Position
@@ -329,13 +329,13 @@ class StaffManager(ObjectManager):
 ################################################################################
     async def remove_position(self, position: Position) -> None:
 
+        role = await position.role
         for staff in self.staff:
             if position in staff.qualifications:
                 staff.qualifications.remove(position)
                 member = await self.guild.get_or_fetch_member(staff._user.id)
-                role = await position.role
-                if role is not None:
-                    await member.remove_roles(role)
+                if member is not None:
+                    await RoleUpdate(member).remove(role).apply(reason="Position Removed")
 
 ################################################################################
 
@@ -9,6 +9,7 @@ from Classes.Common import ManagedObject, LazyUser
 from UI.Common import FroggeSelectView, ConfirmCancelView, BasicTextModal
 from UI.Staffing import StaffMemberMenuView, StaffProfilesMainMenuView
 from Utilities import Utilities as U
+from Utilities.Constants import STAFF_HISTORY_DISPLAY_COUNT
 from .StaffCharacter import StaffCharacter
 from .StaffConfiguration import StaffConfiguration
 from .StaffDetails import StaffDetails
@@ -147,6 +148,13 @@ class StaffMember(ManagedObject):
             term = U.format_dt(ep.termination_date, 'd') if ep.termination_date else "`Current`"
             employment_dates_string += f"* {U.format_dt(ep.hire_date, 'd')} - {term}\n"
 
+        history = await self.guild.event_manager.staff_history(self)
+        history.sort(key=lambda e: e.start_time.timestamp() if e.start_time else 0, reverse=True)
+        history_string = "\n".join(
+            f"* `{e.name}` - {U.format_dt(e.start_time, 'd') if e.start_time else '`Unknown`'}"
+            for e in history[:STAFF_HISTORY_DISPLAY_COUNT]
+        ) or "`None`"
+
         user = await self.user
         return U.make_embed(
             title=f"{self._details.name}'s Employee Record",
@@ -156,6 +164,7 @@ class StaffMember(ManagedObject):
                 f"**Birthday:** `{self._details.birthday.strftime('%m/%d') if self._details.birthday else 'Not Set'}`\n"
                 f"**Employment History:**\n"
                 f"{employment_dates_string}"
+                f"**Events Worked:** `{len(history)}`"
             ),
             fields=[
                 EmbedField(
@@ -168,6 +177,11 @@ class StaffMember(ManagedObject):
                     value="\n".join(f"* `{p.name}`" for p in self.positions) or "`None`",
                     inline=True
                 ),
+                EmbedField(
+                    name="__Recent Events__",
+                    value=history_string,
+                    inline=False
+                ),
                 EmbedField(
                     name="__Internal Notes__",
                     value=f"```{self._details.notes}```" if self._details.notes else "```None```",
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Type, TypeVar, Any, Dict
-from discord import Embed, EmbedField, Interaction, Forbidden, NotFound
+from discord import Embed, EmbedField, Interaction, Forbidden, Member, NotFound
 
-from Errors import InsufficientPermissions, RoleMissing
+from Classes.Common import RoleUpdate
+from Errors import InsufficientPermissions, UserMissing
 from UI.Common import FroggeSelectView
 from Utilities import Utilities as U
 from UI.Staffing import StaffQualificationMenuView
@@ -106,18 +107,7 @@ class StaffQualifications:
         self._parent.update()
 
         server_member = await self._parent.guild.get_or_fetch_member(self._parent._user.id)
-        for pos in positions:
-            role = await pos.role  # type: ignore
-            if role is None:
-                continue
-            try:
-                await server_member.add_roles(role)
-            except Forbidden:
-                error = InsufficientPermissions(None, "Add Roles")
-                await interaction.respond(embed=error, ephemeral=True)
-            except NotFound:
-                error = RoleMissing(role.name)
-                await interaction.respond(embed=error, ephemeral=True)
+        await self._apply_roles(interaction, server_member, positions, add=True)
 
 ################################################################################
     async def remove_qualifications(self, interaction: Interaction) -> None:
@@ -147,24 +137,33 @@ class StaffQualifications:
         positions = [self._parent.manager.guild.position_manager[p] for p in view.value]
 
         server_member = await self._parent.guild.get_or_fetch_member(self._parent._user.id)
-        for pos in positions:
-            role = await pos.role  # type: ignore
-            if role is None:
-                continue
-            try:
-                await server_member.remove_roles(role)
-            except Forbidden:
-                error = InsufficientPermissions(None, "Remove Roles")
-                await interaction.respond(embed=error, ephemeral=True)
-            except NotFound:
-                error = RoleMissing(role.name)
-                await interaction.respond(embed=error, ephemeral=True)
+        await self._apply_roles(interaction, server_member, positions, add=False)
 
         for p in positions:
             if p in self._qualifications:
                 self._qualifications.remove(p)  # type: ignore
         self._parent.update()
 
+################################################################################
+    @staticmethod
+    async def _apply_roles(interaction: Interaction, member: Member, positions: List[Position], add: bool) -> None:
+
+        roles = [await pos.role for pos in positions]  # type: ignore
+        update = RoleUpdate(member)
+        if add:
+            update.add(*roles)
+        else:
+            update.remove(*roles)
+
+        try:
+            await update.apply()
+        except Forbidden:
+            error = InsufficientPermissions(None, "Manage Roles")
+            await interaction.respond(embed=error, ephemeral=True)
+        except NotFound:
+            error = UserMissing(member.id)
+            await interaction.respond(embed=error, ephemeral=True)
+
 ################################################################################
     def remove(self, position: Position) -> None:
 
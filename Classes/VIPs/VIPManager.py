@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Any, Dict, Optional
+import asyncio
+from typing import TYPE_CHECKING, Collection, List, Any, Dict, Optional
 
 from discord import (
     Message,
@@ -9,6 +10,7 @@ from discord import (
     Interaction,
     Member,
     Forbidden,
+    HTTPException,
     NotFound,
     SelectOption,
     User,
@@ -17,14 +19,15 @@ from discord import (
 from Assets import BotEmojis
 from Enums import VIPMessageType
 from Utilities import Utilities as U, FroggeColor
-from Utilities.Constants import DEFAULT_VIP_WARNING_DAYS
+from Utilities.Constants import DEFAULT_VIP_WARNING_DAYS, VIP_ROLE_SYNC_CONCURRENCY
 from .VIPMemberManager import VIPMemberManager
 from .VIPMessage import VIPMessage
 from UI.VIPs import VIPManagerMenuView, VIPMessageManagementView
 from .VIPTierManager import VIPTierManager
 from UI.Common import FroggeSelectView, ConfirmCancelView
 from Errors import InsufficientPermissions
-from Classes.Common import LazyMessage
+from Classes.Common import LazyMessage, RoleUpdate, RoleSyncReport
+from logger import log
 
 if TYPE_CHECKING:
     from Classes import GuildData, FroggeBot, VIPTier, VIPMember, VIPPerk
@@ -44,6 +47,7 @@ class VIPManager:
         "_warning_threshold",
         "_post_msgs",
         "_perks_msgs",
+        "_perks",
     )
     
 ################################################################################
@@ -61,11 +65,16 @@ class VIPManager:
         
         self._post_msgs: List[LazyMessage] = []
         self._perks_msgs: List[LazyMessage] = []
+
+        # perk ID -> perk, across every tier
+        self._perks: Dict[int, VIPPerk] = {}
     
 ################################################################################
     async def load_all(self, data: Dict[str, Any]) -> None:
         
         await self._tier_mgr.load_all(data["tiers"])
+        # Perks must be indexed before members load their overrides.
+        self._perks = {perk.id: perk for tier in self.tiers for perk in tier.perks}
         await self._member_mgr.load_all(data["members"])
         
         self._warning_threshold = data.get("warning_threshold", DEFAULT_VIP_WARNING_DAYS)
@@ -82,7 +91,7 @@ class VIPManager:
 ################################################################################
     def __getitem__(self, item_id: int) -> Optional[VIPMember]:
 
-        return next((member for member in self.members if member.id == int(item_id)), None)
+        return self._member_mgr[item_id]
 
 ################################################################################
     @property
@@ -308,13 +317,104 @@ class VIPManager:
                 self._perks_msgs.remove(message)
                 self.update()
 
+################################################################################
+    async def reconcile_roles(self, user_ids: Optional[Collection[int]] = None) -> RoleSyncReport:
+
+        report = RoleSyncReport()
+
+        tier_roles = {tier.id: await tier.role for tier in self.tiers}
+        vip_role_ids = {r.id for r in tier_roles.values() if r is not None}
+        if not vip_role_ids:
+            return report
+
+        desired = {}
+        for vip in self.members:
+            if user_ids is not None and vip._user.id not in user_ids:
+                continue
+            # Without a live tier there's no role to map to, so leave them be.
+            if vip.tier is None or vip.tier.id not in tier_roles:
+                report.skipped.append(vip._user.id)
+                continue
+            desired[vip._user.id] = tier_roles[vip.tier.id]
+
+        if user_ids is None:
+            members = self.guild.parent.members
+        else:
+            members = [m for uid in user_ids if (m := self.guild.parent.get_member(uid))]
+
+        skipped = set(report.skipped)
+        updates = []
+        for member in members:
+            if member.id in skipped:
+                continue
+            report.checked += 1
+            update = (
+                RoleUpdate(member)
+                .remove(*[r for r in member.roles if r.id in vip_role_ids])
+                .add(desired.get(member.id))
+            )
+            if update.changed:
+                updates.append(update)
+
+        report.missing = [uid for uid in desired if self.guild.parent.get_member(uid) is None]
+
+        limit = asyncio.Semaphore(VIP_ROLE_SYNC_CONCURRENCY)
+
+        async def _apply(update: RoleUpdate) -> None:
+            added, removed = len(update.added), len(update.removed)
+            async with limit:
+                try:
+                    await update.apply(reason="VIP Role Sync")
+                except (Forbidden, NotFound, HTTPException):
+                    report.failed.append(update.member)
+                    return
+            report.updated += 1
+            report.added += added
+            report.removed += removed
+
+        await asyncio.gather(*[_apply(u) for u in updates])
+
+        log.info(self.guild, f"VIP role sync: {report.summary()}")
+        return report
+
+################################################################################
+    async def sync_roles(self, interaction: Interaction) -> None:
+
+        inter = await interaction.respond("Syncing VIP Roles, Please Wait...")
+        report = await self.reconcile_roles()
+
+        try:
+            await inter.delete()
+        except NotFound:
+            pass
+
+        confirm = U.make_embed(
+            title="VIP Role Sync Complete",
+            description=(
+                f"Checked `{report.checked:,}` members and updated `{report.updated:,}`.\n"
+                f"Roles Added: `{report.added:,}`\n"
+                f"Roles Removed: `{report.removed:,}`\n"
+                f"Failed: `{len(report.failed):,}`\n"
+                f"VIPs Not In Server: `{len(report.missing):,}`\n"
+                f"Skipped (No Tier): `{len(report.skipped):,}`"
+            )
+        )
+        await interaction.respond(embed=confirm, ephemeral=True)
+
 ################################################################################
     def get_perk(self, perk_id: int) -> Optional[VIPPerk]:
 
-        for tier in self.tiers:
-            for perk in tier.perks:
-                if perk.id == perk_id:
-                    return perk
+        return self._perks.get(perk_id)
+
+################################################################################
+    def register_perk(self, perk: VIPPerk) -> None:
+
+        self._perks[perk.id] = perk
+
+################################################################################
+    def unregister_perk(self, perk: VIPPerk) -> None:
+
+        self._perks.pop(perk.id, None)
 
 ################################################################################
     async def message_management(self, interaction: Interaction) -> None:
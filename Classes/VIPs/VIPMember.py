@@ -5,9 +5,9 @@ from typing import TYPE_CHECKING, Optional, List, Type, TypeVar, Any, Dict
 
 from discord import User, Embed, Interaction, Forbidden, NotFound
 
-from Classes.Common import ManagedObject, LazyUser
+from Classes.Common import ManagedObject, LazyUser, RoleUpdate
 from Enums import RedemptionLevel
-from Errors import UserMissing, RoleMissing, InsufficientPermissions, DateBeforeNow
+from Errors import UserMissing, InsufficientPermissions, DateBeforeNow
 from UI.Common import (
     FroggeView,
     FroggeSelectView,
@@ -53,7 +53,10 @@ class VIPMember(ManagedObject):
         self._join_date: datetime = kwargs.pop("join_date")
         self._expiry_date: Optional[datetime] = kwargs.get("expiry_date")
         
-        self._overrides: List[VIPPerkOverride] = kwargs.get("overrides", [])
+        # Keyed by perk ID
+        self._overrides: Dict[int, VIPPerkOverride] = {
+            o.perk.id: o for o in kwargs.get("overrides", [])
+        }
     
 ################################################################################
     @classmethod
@@ -85,7 +88,10 @@ class VIPMember(ManagedObject):
         self._join_date = datetime.fromisoformat(data["join_date"])
         self._expiry_date = datetime.fromisoformat(data["expiry_date"]) if data["expiry_date"] else None
         
-        self._overrides = [VIPPerkOverride.load(self, override) for override in data["overrides"]]
+        self._overrides = {
+            override["perk_id"]: VIPPerkOverride.load(self, override)
+            for override in data["overrides"]
+        }
         
         return self
     
@@ -98,7 +104,8 @@ class VIPMember(ManagedObject):
     @tier.setter
     def tier(self, value: VIPTier) -> None:
         
-        self._tier = value
+        old_tier, self._tier = self._tier, value
+        self._mgr.retier(self, old_tier)  # type: ignore
         self.update()
         
 ################################################################################
@@ -135,8 +142,13 @@ class VIPMember(ManagedObject):
     @property
     def overrides(self) -> List[VIPPerkOverride]:
         
-        return self._overrides
+        return list(self._overrides.values())
     
+################################################################################
+    def get_override(self, perk_id: int) -> Optional[VIPPerkOverride]:
+
+        return self._overrides.get(perk_id)
+
 ################################################################################
     @property
     def notes(self) -> Optional[str]:
@@ -174,7 +186,7 @@ class VIPMember(ManagedObject):
     def delete(self) -> None:
 
         self.bot.api.delete_vip_member(self.id)
-        self._mgr._managed.remove(self)
+        self._mgr.remove(self)  # type: ignore
 
 ################################################################################
     async def status(self) -> Embed:
@@ -266,32 +278,21 @@ class VIPMember(ManagedObject):
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        error = None
-
-        user = await self.user
+        # Remove first so a tier sharing the old role keeps it.
+        update = RoleUpdate(user)  # type: ignore
+        if old_tier._role.id is not None:
+            update.remove(await old_tier.role)
         if new_tier._role.id is not None:
-            role = await new_tier.role
-            try:
-                await user.add_roles(role, reason="VIP Tier Change")  # type: ignore
-            except Forbidden:
-                error = InsufficientPermissions(None, "Add Roles")
-            except NotFound:
-                error = RoleMissing(role.name)
-
-        if error is not None:
+            update.add(await new_tier.role)
+
+        try:
+            await update.apply(reason="VIP Tier Change")
+        except Forbidden:
+            error = InsufficientPermissions(None, "Manage Roles")
             await interaction.respond(embed=error, ephemeral=True)
             return
-
-        if old_tier._role.id is not None:
-            role = await old_tier.role
-            try:
-                await user.remove_roles(role, reason="VIP Tier Change")  # type: ignore
-            except Forbidden:
-                error = InsufficientPermissions(None, "Remove Roles")
-            except NotFound:
-                error = RoleMissing(role.name)
-
-        if error is not None:
+        except NotFound:
+            error = UserMissing(self._user.id)
             await interaction.respond(embed=error, ephemeral=True)
             return
 
@@ -344,10 +345,8 @@ class VIPMember(ManagedObject):
         options = []
         for perk in self.tier.perks:
             option = perk.select_option()
-            for override in self.overrides:
-                if override.perk.id == perk.id:
-                    option.description = f"({override.level.proper_name})"
-                    break
+            if override := self.get_override(perk.id):
+                option.description = f"({override.level.proper_name})"
             options.append(option)
 
         prompt = U.make_embed(
@@ -394,17 +393,16 @@ class VIPMember(ManagedObject):
 
         for override in self.overrides:
             override.delete()
+        self._overrides.clear()
 
 ################################################################################
     def add_override(self, perk: VIPPerk, level: RedemptionLevel) -> None:
 
-        for override in self.overrides:
-            if override.perk.id == perk.id:
-                override.level = level
-                return
+        if override := self._overrides.get(perk.id):
+            override.level = level
+            return
 
-        override = VIPPerkOverride.new(self, perk, level)
-        self.overrides.append(override)
+        self._overrides[perk.id] = VIPPerkOverride.new(self, perk, level)
 
 ################################################################################
     async def add_membership(self, interaction: Interaction) -> None:
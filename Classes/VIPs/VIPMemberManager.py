@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from datetime import timedelta, datetime
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from discord import Interaction, User, Embed, EmbedField, Member
 
@@ -25,10 +25,26 @@ __all__ = ("VIPMemberManager", )
 ################################################################################
 class VIPMemberManager(ObjectManager):
 
+    __slots__ = (
+        "_by_id",
+        "_by_user",
+        "_by_tier",
+    )
+
     def __init__(self, state: GuildData) -> None:
 
         super().__init__(state)
+
+        self._by_id: Dict[int, VIPMember] = {}
+        self._by_user: Dict[int, VIPMember] = {}
+        # tier ID -> {member ID -> member}; dicts keep insertion order.
+        self._by_tier: Dict[int, Dict[int, VIPMember]] = {}
     
+################################################################################
+    def __getitem__(self, item_id: int) -> Optional[VIPMember]:
+
+        return self._by_id.get(int(item_id))
+
 ################################################################################
     @property
     def members(self) -> List[VIPMember]:
@@ -38,19 +54,69 @@ class VIPMemberManager(ObjectManager):
 ################################################################################
     def get_member_by_user_id(self, user_id: int) -> Optional[VIPMember]:
         
-        return next((member for member in self.members if member._user.id == user_id), None)
+        return self._by_user.get(user_id)
     
+################################################################################
+    def members_of(self, tier: VIPTier) -> List[VIPMember]:
+
+        return list(self._by_tier.get(tier.id, {}).values())
+
+################################################################################
+    def _index(self, member: VIPMember) -> None:
+
+        self._by_id[member.id] = member
+        self._by_user[member._user.id] = member
+        # Members whose tier has been deleted aren't listed under any tier.
+        if member.tier is not None:
+            self._by_tier.setdefault(member.tier.id, {})[member.id] = member
+
+################################################################################
+    def _unindex(self, member: VIPMember, tier: Optional[VIPTier] = None) -> None:
+
+        self._by_id.pop(member.id, None)
+        self._by_user.pop(member._user.id, None)
+        if (tier := tier or member.tier) is not None:
+            self._by_tier.get(tier.id, {}).pop(member.id, None)
+
+################################################################################
+    def drop_tier(self, tier: VIPTier) -> None:
+
+        self._by_tier.pop(tier.id, None)
+
+################################################################################
+    def add(self, member: VIPMember) -> None:
+
+        self._managed.append(member)
+        self._index(member)
+
+################################################################################
+    def remove(self, member: VIPMember) -> None:
+
+        self._managed.remove(member)
+        self._unindex(member)
+
+################################################################################
+    def retier(self, member: VIPMember, old_tier: VIPTier) -> None:
+
+        self._unindex(member, old_tier)
+        self._index(member)
+
 ################################################################################
     async def load_all(self, payload: Any) -> None:
 
         self._managed = [VIPMember.load(self, member) for member in payload]
 
+        self._by_id, self._by_user, self._by_tier = {}, {}, {}
+        for member in self._managed:
+            self._index(member)
+
 ################################################################################
     async def status(self) -> Embed:
 
         tier_dict = {tier.id: 0 for tier in self.guild.vip_manager.tiers}
         for member in self.members:
-            tier_dict[member.tier.id] += 1
+            if member.tier is not None and member.tier.id in tier_dict:
+                tier_dict[member.tier.id] += 1
 
         field_str = "\n".join([
             f"* **{self.guild.vip_manager.tier_manager[tier_id].name}** - {count} members"  # type: ignore
@@ -152,7 +218,7 @@ class VIPMemberManager(ObjectManager):
             end_date = datetime.now() + timedelta(days=parsed)
 
         member = VIPMember.new(self, user, tier, end_date)
-        self.members.append(member)
+        self.add(member)
         
         log.info(self.guild, f"VIP member added: {user.id}")
         await self.guild.vip_manager.update_post_components()
@@ -278,7 +344,7 @@ class VIPMemberManager(ObjectManager):
 
         tier = self.guild.vip_manager.tier_manager[view.value]
         member = VIPMember.new(self, user, tier)  # type: ignore
-        self.members.append(member)
+        self.add(member)
 
         await member.menu(interaction)
 
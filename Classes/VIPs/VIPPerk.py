@@ -113,6 +113,7 @@ class VIPPerk:
         
         self._mgr.bot.api.delete_vip_perk(self)
         self._mgr.perks.remove(self)
+        self._mgr.guild.vip_manager.unregister_perk(self)
         
 ################################################################################
     def to_dict(self) -> Dict[str, Any]:
@@ -90,6 +90,7 @@ class VIPPerksManager:
 
         new_perk = VIPPerk.new(self)
         self._perks.append(new_perk)
+        self.guild.vip_manager.register_perk(new_perk)
         
         new_perk.text = modal.value
         await new_perk.menu(interaction)
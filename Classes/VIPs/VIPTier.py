@@ -178,7 +178,7 @@ class VIPTier(ManagedObject):
     @property
     def members(self) -> List[VIPMember]:
         
-        return [m for m in self.guild.vip_manager.members if m.tier == self]
+        return self.guild.vip_manager.member_manager.members_of(self)
     
 ################################################################################
     def update(self) -> None:
@@ -190,6 +190,9 @@ class VIPTier(ManagedObject):
         
         self.bot.api.delete_vip_tier(self)
         self._mgr.tiers.remove(self)  # type: ignore
+        for perk in self.perks:
+            self.guild.vip_manager.unregister_perk(perk)
+        self.guild.vip_manager.member_manager.drop_tier(self)
         
 ################################################################################
     def to_dict(self) -> Dict[str, Any]:
@@ -207,16 +207,21 @@ class VIPTierManager(ObjectManager):
 
         await self.guild.log.bulk_tier_reassignment(from_tier.members, to_tier)  # type: ignore
 
-        for member in from_tier.members:  # type: ignore
+        moved = from_tier.members  # type: ignore
+        for member in moved:
             member.tier = to_tier
 
+        # Move the transferred members' tier roles across in one pass.
+        report = await self.guild.vip_manager.reconcile_roles({m._user.id for m in moved})
+
         await inter.delete()
 
         confirm = U.make_embed(
             title="Bulk Transfer Complete",
             description=(
-                f"`{len(from_tier.members)}` members have been successfully transferred "  # type: ignore
-                f"from the VIP Tier `{from_tier.name}` to the VIP Tier `{to_tier.name}`."  # type: ignore
+                f"`{len(moved)}` members have been successfully transferred "
+                f"from the VIP Tier `{from_tier.name}` to the VIP Tier `{to_tier.name}`.\n\n"  # type: ignore
+                f"Role Sync: `{report.summary()}`"
             )
         )
         await interaction.respond(embed=confirm)
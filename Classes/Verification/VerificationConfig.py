@@ -21,6 +21,7 @@ class VerificationConfig:
         "_require_captcha",
         "_require_2fa",
         "_change_name",
+        "_trust_shared",
         "_role",
     )
     
@@ -33,6 +34,7 @@ class VerificationConfig:
         self._require_captcha: bool = kwargs.get("require_capcha", True)
         self._require_2fa: bool = kwargs.get("require_2fa", True)
         self._change_name: bool = kwargs.get("change_name", True)
+        self._trust_shared: bool = kwargs.get("trust_shared", False)
         self._role: LazyRole = LazyRole(self, kwargs.get("role_id"))
     
 ################################################################################
@@ -42,6 +44,7 @@ class VerificationConfig:
         self._require_captcha = data["show_captcha"]
         self._require_2fa = data["user_two_factor"]
         self._change_name = data["change_nickname"]
+        self._trust_shared = data.get("trust_shared_identity", False)
         self._role = LazyRole(self, data.get("role_id"))
     
 ################################################################################
@@ -110,6 +113,18 @@ class VerificationConfig:
         self._change_name = value
         self.update()
 
+################################################################################
+    @property
+    def trust_shared(self) -> bool:
+
+        return self._trust_shared
+
+    @trust_shared.setter
+    def trust_shared(self, value: bool) -> None:
+
+        self._trust_shared = value
+        self.update()
+
 ################################################################################
     @property
     async def role(self) -> Optional[Role]:
@@ -134,6 +149,7 @@ class VerificationConfig:
             "show_captcha": self.require_captcha,
             "user_two_factor": self.require_2fa,
             "change_nickname": self.change_name,
+            "trust_shared_identity": self.trust_shared,
             "role_id": self._role.id
         }
     
@@ -161,4 +177,10 @@ class VerificationConfig:
         self.require_2fa = not self.require_2fa
         await interaction.respond("** **", delete_after=0.1)
 
+################################################################################
+    async def toggle_trust_shared(self, interaction: Interaction) -> None:
+
+        self.trust_shared = not self.trust_shared
+        await interaction.respond("** **", delete_after=0.1)
+
 ################################################################################
@@ -58,6 +58,24 @@ class VerificationData(ManagedObject):
             lodestone_id=data["lodestone_id"]
         )
 
+################################################################################
+    @property
+    def user_id(self) -> int:
+
+        return self._user_id
+
+################################################################################
+    @property
+    def name(self) -> str:
+
+        return self._name
+
+################################################################################
+    @property
+    def lodestone_id(self) -> int:
+
+        return self._lodestone_id
+
 ################################################################################
     def status(self) -> Embed:
 
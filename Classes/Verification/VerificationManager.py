@@ -1,36 +1,33 @@
 from __future__ import annotations
 
-import os
 import random
 import uuid
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from captcha.image import ImageCaptcha
 from discord import (
     Interaction,
     User,
     Embed,
     EmbedField,
-    TextChannel,
-    File,
     NotFound,
     Forbidden,
     SelectOption
 )
 
 from Assets import BotEmojis
-from Classes.Common import ObjectManager
+from Classes.Common import ObjectManager, RoleUpdate
 from Enums import GameWorld
 from Errors import MaxItemsReached, InsufficientPermissions, UnableToVerify
 from UI.Common import FroggeSelectView, ConfirmCancelView
 from UI.Verification import VerificationManagerMenuView, CharacterNameModal, HomeWorldSelectView
-from Utilities import Utilities as U
+from Utilities import Utilities as U, Attachments
+from Utilities.Constants import REVALIDATE_SHARED_IDENTITIES
 from .VerificationConfig import VerificationConfig
 from .VerificationData import VerificationData
 from .VerificationRoleRelation import VerificationRoleRelation
 
 if TYPE_CHECKING:
-    from Classes import GuildData
+    from Classes import GuildData, LodestoneCharacter
     from UI.Common import FroggeView
 ################################################################################
 
@@ -41,19 +38,15 @@ class VerificationManager(ObjectManager):
 
     __slots__ = (
         "_config",
-        "_void",
         "_relations",
     )
 
-    CAPTCHA_VOID = 1260812137220149268
-    
 ################################################################################
     def __init__(self, state: GuildData) -> None:
 
         super().__init__(state)
         
         self._config: VerificationConfig = VerificationConfig(self)
-        self._void: TextChannel = None  # type: ignore
         self._relations: List[VerificationRoleRelation] = []
     
 ################################################################################
@@ -64,9 +57,10 @@ class VerificationManager(ObjectManager):
             for verification
             in payload["verifications"]
         ]
+        for verification in self._managed:
+            self.bot.identities.register(verification)
 
         self._config.load(payload["config"])
-        self._void = await self.bot.fetch_channel(self.CAPTCHA_VOID)
         
         self._relations = [
             await VerificationRoleRelation.load(self, relation)
@@ -115,6 +109,8 @@ class VerificationManager(ObjectManager):
                 "to verify their human-ness.*\n"
                 "**[Require 2FA]**: *Users must verify ownership of their "
                 "character by entering a code on their Lodestone profile.*\n"
+                "**[Shared Identity]**: *Users already verified in another "
+                "server are verified instantly as the same character.*\n"
                 "**[Role Relations]**: *The roles that will be swapped "
                 "upon successful verification.*"
             ),
@@ -144,7 +140,11 @@ class VerificationManager(ObjectManager):
                     value=check(self._config.require_2fa),
                     inline=True
                 ),
-                EmbedField("** **", "** **", True),
+                EmbedField(
+                    name="Shared Identity",
+                    value=check(self._config.trust_shared),
+                    inline=True
+                ),
                 EmbedField(
                     name="__Role Relations__",
                     value=col1,
@@ -252,6 +252,11 @@ class VerificationManager(ObjectManager):
 
         await self._config.toggle_2fa(interaction)
 
+################################################################################
+    async def toggle_trust_shared(self, interaction: Interaction) -> None:
+
+        await self._config.toggle_trust_shared(interaction)
+
 ################################################################################
     async def verify(self, interaction: Interaction) -> None:
 
@@ -263,54 +268,91 @@ class VerificationManager(ObjectManager):
                 return
 
         interaction = inter or interaction
-        forename = surname = None
+        forename = surname = world = None
+        character_id = verification_code = None
+        verified = False
+
+        # The character name as known so far, shared by the steps below.
+        char_name = None
+
+        identity = (
+            self.bot.identities.get(interaction.user.id)
+            if self._config.trust_shared
+            else None
+        )
+        if identity is not None and (self._config.require_2fa or self._config.change_name):
+            # Already verified in another guild - skip steps 2 & 3 entirely.
+            forename, _, surname = identity.name.partition(" ")
+            character_id = identity.lodestone_id
+            char_name = identity.name
+
+            if self._config.require_2fa:
+                self._record_verification(interaction.user, identity.name, character_id)
+            if REVALIDATE_SHARED_IDENTITIES:
+                self.bot.identities.revalidate(interaction.user.id)
 
-        if self._config.require_2fa or self._config.change_name:
+        elif self._config.require_2fa or self._config.change_name:
             # Step 2: Enter Name and World
             raw = await self.get_name_and_world(interaction)
             if raw is None:
                 return
 
-            forename, surname, _ = raw
+            forename, surname, world = raw
 
-            character_id = await self.bot.lodestone.fetch_character_id(interaction, *raw)
-            if character_id is None:
+            # Step 3a: 2FA prompt - it waits on the user, so it happens before
+            # the backend steps are queued.
+            if self._config.require_2fa:
+                verified, verification_code = await self.secondary_verification(interaction)
+
+        # Everything from here only touches the Lodestone and Discord, so the
+        # whole lot shares a single slot in the bot-wide verification queue.
+        async with self.bot.verify_queue.slot(interaction, self.guild_id) as admitted:
+            if not admitted:
                 return
 
-            # Step 3: 2FA Verification
-            if self._config.require_2fa:
-                if await self.secondary_verification(interaction, character_id):
-                    verification = VerificationData.new(
-                        mgr=self,
-                        user=interaction.user,
-                        name=f"{forename} {surname}",
-                        lodestone_id=character_id
-                    )
-                    self._managed.append(verification)
+            if world is not None:
+                character_id = await self.bot.lodestone.fetch_character_id(
+                    interaction, forename, surname, world
+                )
+                if character_id is None:
+                    return
+
+                # Step 3b: 2FA check
+                if verification_code is not None:
+                    character = await self.check_two_step(interaction, character_id, verification_code)
+                    verified = character is not None
+                    if character is not None:
+                        char_name = character.name
+                if verified:
+                    self._record_verification(interaction.user, f"{forename} {surname}", character_id)
 
             # Step 4: Change server nickname
-            if self._config.change_name:
-                await self.set_server_nickname(interaction, character_id)
+            if self._config.change_name and forename is not None:
+                await self.set_server_nickname(interaction, character_id, char_name)
+
+            # Step 5: Swap Roles - worked out in memory, applied in one edit
+            message_str = ""
+            member = await self.guild.get_or_fetch_member(interaction.user.id)
+            update = RoleUpdate(member)
+
+            if self._config._role.id is not None:
+                role = await self._config.role
+                if role is not None:
+                    update.add(role)
+                    message_str += f"Added {role.mention} role\n"
 
-        # Step 5: Swap Roles
-        message_str = ""
-        member = await self.guild.get_or_fetch_member(interaction.user.id)
+            for roles in self._relations:
+                result = await roles.check_swap(update)
+                if result is not None:
+                    message_str += (result + "\n")
 
-        if self._config._role.id is not None:
-            role = await self._config.role
             try:
-                await member.add_roles(role)
-                message_str += f"Added {role.mention} role\n"
+                await update.apply(reason="Verification")
             except Forbidden:
-                error = InsufficientPermissions(None, "Add Roles")
+                error = InsufficientPermissions(None, "Manage Roles")
                 await interaction.respond(embed=error, ephemeral=True)
                 return
 
-        for roles in self._relations:
-            result = await roles.check_swap(interaction, member)
-            if result is not None:
-                message_str += (result + "\n")
-
         # Step 6: Log Verification
         if self._config.log_events:
             if forename is not None:
@@ -321,24 +363,18 @@ class VerificationManager(ObjectManager):
         await interaction.respond(message_str or f"Success! You are now verified.", ephemeral=True)
 
 ################################################################################
-    async def verify_captcha(self, interaction: Interaction) -> Optional[Interaction]:
-
-        try:
-            await interaction.response.defer(invisible=False)
-        except:
-            pass
+    def _record_verification(self, user: User, name: str, lodestone_id: int) -> None:
 
-        code = str(random.randint(100000, 999999))
-        fp = f"Files/{code}captcha.png"
+        verification = VerificationData.new(mgr=self, user=user, name=name, lodestone_id=lodestone_id)
+        self._managed.append(verification)
+        self.bot.identities.register(verification)
 
-        captcha = ImageCaptcha()
-        captcha.write(code, fp)
+################################################################################
+    async def verify_captcha(self, interaction: Interaction) -> Optional[Interaction]:
 
-        file = File(fp, filename="captcha.png")
-        if self._void is None:
-            self._void = await self.bot.fetch_channel(self.CAPTCHA_VOID)
-        message = await self._void.send(file=file)
-        image_url = message.attachments[0].url
+        # Pre-rendered, so the prompt goes out in a single round trip.
+        code, image = await self.bot.captchas.take()
+        file = Attachments.from_bytes(image, "captcha.png")
 
         options = [SelectOption(label=code, value=code)]
         for i in range(1, 5):
@@ -355,15 +391,13 @@ class VerificationManager(ObjectManager):
             title="__Human Verification__",
             description=(
                 "Please verify you are human by selecting the following "
-                "code from the drop-down.\n\n"
-
-                f"If you are unable to see the image, [please click here]({image_url})."
+                "code from the drop-down."
             ),
-            image_url=image_url
+            image_url="attachment://captcha.png"
         )
         view = FroggeSelectView(interaction.user, options, return_interaction=True)
 
-        inter = await interaction.respond(embed=prompt, view=view, ephemeral=True)
+        inter = await interaction.respond(embed=prompt, view=view, file=file, ephemeral=True)
         await view.wait()
 
         if not view.complete or view.value is False:
@@ -377,15 +411,14 @@ class VerificationManager(ObjectManager):
             return
 
         try:
-            await inter.delete()
+            # An initial response comes back as the interaction itself.
+            if isinstance(inter, Interaction):
+                await inter.delete_original_response()
+            else:
+                await inter.delete()
         except NotFound:
             pass
 
-        try:
-            os.remove(fp)
-        except:
-            pass
-
         return inter2
 
 ################################################################################
@@ -414,15 +447,10 @@ class VerificationManager(ObjectManager):
             return
 
         _, world = view.value
-
-        character_id = await self.bot.lodestone.fetch_character_id(interaction, forename, surname, world)
-        if character_id is None:
-            return
-
         return forename, surname, world
 
 ################################################################################
-    async def secondary_verification(self, interaction: Interaction, character_id: int) -> bool:
+    async def secondary_verification(self, interaction: Interaction) -> Tuple[bool, Optional[str]]:
 
         prompt = U.make_embed(
             title="__Secure Character Verification__",
@@ -439,18 +467,15 @@ class VerificationManager(ObjectManager):
         await view.wait()
 
         if not view.complete:
-            return False
+            return False, None
         elif view.value is False:
-            return True
-
-        verified = await self.verify_character_two_step(interaction, character_id)
-        if not verified:
-            return False
+            return True, None
 
-        return True
+        # Not verified until the code is found in the bio.
+        return False, await self.prompt_two_step(interaction)
 
 ################################################################################
-    async def verify_character_two_step(self, interaction: Interaction, char_id: int) -> bool:
+    async def prompt_two_step(self, interaction: Interaction) -> Optional[str]:
 
         verification_code = uuid.uuid4().hex
         prompt = U.make_embed(
@@ -472,11 +497,21 @@ class VerificationManager(ObjectManager):
         if not view.complete or view.value is False:
             error = UnableToVerify()
             await interaction.respond(embed=error, ephemeral=True)
-            return False
+            return
+
+        return verification_code
 
-        bio = await self.bot.lodestone.fetch_character_bio(interaction, char_id)
+################################################################################
+    async def check_two_step(
+        self, interaction: Interaction, char_id: int, verification_code: str
+    ) -> Optional[LodestoneCharacter]:
+
+        # The code was only just added, so this must bypass the cache.
+        character = await self.bot.lodestone.fetch_character(interaction, char_id, fresh=True)
+        if character is None:
+            return
 
-        if verification_code not in bio:
+        if verification_code not in character.bio:
             error = U.make_error(
                 title="Invalid Profile Verification Code",
                 message="The verification code provided could not be found in your character's bio section.",
@@ -486,14 +521,21 @@ class VerificationManager(ObjectManager):
                 )
             )
             await interaction.respond(embed=error, ephemeral=True)
-            return False
+            return
 
-        return True
+        return character
 
 ################################################################################
-    async def set_server_nickname(self, interaction: Interaction, character_id: int) -> bool:
-
-        char_name = await self.bot.lodestone.fetch_character_name(interaction, character_id)
+    async def set_server_nickname(
+        self,
+        interaction: Interaction,
+        character_id: int,
+        char_name: Optional[str] = None
+    ) -> bool:
+
+        if char_name is None:
+            character = await self.bot.lodestone.fetch_character(interaction, character_id)
+            char_name = character.name if character is not None else None
         member = await self._state.get_or_fetch_member(interaction.user.id)
 
         if char_name is None or member is None:
@@ -8,14 +8,11 @@ from discord import (
     Embed,
     EmbedField,
     Role,
-    Interaction,
-    Member,
-    Forbidden
+    Interaction
 )
 
-from Classes.Common import ManagedObject, LazyRole
+from Classes.Common import ManagedObject, LazyRole, RoleUpdate
 from Classes.Common.FroggeObject import T
-from Errors import InsufficientPermissions
 from UI.Common import ConfirmCancelView, BasicTextModal
 from UI.Verification import RoleRelationStatusView
 from Utilities import Utilities as U
@@ -239,7 +236,7 @@ class VerificationRoleRelation(ManagedObject):
         self.delete()
 
 ################################################################################
-    async def check_swap(self, interaction: Interaction, member: Member) -> Optional[str]:
+    async def check_swap(self, update: RoleUpdate) -> Optional[str]:
 
         pending_role = await self.pending_role
         final_role = await self.final_role
@@ -247,17 +244,11 @@ class VerificationRoleRelation(ManagedObject):
         if pending_role is None or final_role is None:
             return
 
-        if pending_role not in member.roles:
+        if pending_role not in update:
             return
 
-        try:
-            await member.remove_roles(pending_role)
-            await member.add_roles(final_role)
-        except Forbidden:
-            error = InsufficientPermissions(None, "Manage Roles")
-            await interaction.respond(embed=error, ephemeral=True)
-        else:
-            return self.message
+        update.remove(pending_role).add(final_role)
+        return self.message
 
 ################################################################################
     async def set_message(self, interaction: Interaction) -> None:
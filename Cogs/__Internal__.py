@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import time, UTC
 from typing import TYPE_CHECKING
 
-from discord import Cog, Guild, ApplicationContext, DiscordException
+from discord import Cog, Guild, ApplicationContext, DiscordException, RawThreadDeleteEvent, Thread
+from discord.abc import GuildChannel
 from discord.ext.tasks import loop
 
 from logger import log
@@ -61,6 +62,31 @@ class Internal(Cog):
 
         await self.bot[member.guild.id].log.member_left(member)
 
+################################################################################
+    @Cog.listener("on_thread_create")
+    async def on_thread_create(self, thread: Thread) -> None:
+
+        self.bot[thread.guild.id].thread_index.register(thread)
+
+################################################################################
+    @Cog.listener("on_thread_update")
+    async def on_thread_update(self, before: Thread, after: Thread) -> None:
+
+        self.bot[after.guild.id].thread_index.rename(before, after)
+
+################################################################################
+    @Cog.listener("on_raw_thread_delete")
+    async def on_thread_delete(self, payload: RawThreadDeleteEvent) -> None:
+
+        # Raw so that uncached (ie. archived) threads are dropped too.
+        self.bot[payload.guild_id].thread_index.unregister_id(payload.parent_id, payload.thread_id)
+
+################################################################################
+    @Cog.listener("on_webhooks_update")
+    async def on_webhooks_update(self, channel: GuildChannel) -> None:
+
+        self.bot.webhooks.invalidate(channel.id)
+
 ################################################################################
     @Cog.listener("on_application_command_error")
     async def on_application_command_error(self, ctx: ApplicationContext, error: DiscordException) -> None:
@@ -33,5 +33,6 @@ class LogType(FroggeEnum):
     UserNotFound = 26
     GiveawayWinnerNotified = 27
     RaffleWinnerNotified = 28
+    ActivityClosed = 29
 
 ################################################################################
@@ -44,20 +44,11 @@ class EventPositionSignupButton(Button):
         
     def set_disabled(self) -> None:
         
-        self.disabled = self.position.signups == self.position.quantity
+        self.disabled = self.position.parent.is_locked_out or self.position.is_full
         
     async def callback(self, interaction: Interaction):
+        # The post itself is re-rendered by the event's debounced refresh.
         await self.position.toggle_user_signup(interaction)
-        self.set_disabled()
-
-        try:
-            await interaction.message.edit(embeds=await self.view.event.compile(), view=self.view)
-        except:
-            try:
-                await interaction.edit_original_response(embeds=await self.view.event.compile(), view=self.view)
-            except Exception as e:
-                print(e)
-                pass
         
 ################################################################################
 class AdministratorConsoleButton(Button):
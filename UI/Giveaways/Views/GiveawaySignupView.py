@@ -41,6 +41,6 @@ class GiveawaySignupButton(FroggeButton):
         
     async def callback(self, interaction: Interaction):
         await self.view.giveaway.signup(interaction)
-        await self.view.giveaway.update_post_components()
+        self.view.giveaway.request_post_refresh()
         
 ################################################################################
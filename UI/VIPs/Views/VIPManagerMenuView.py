@@ -25,6 +25,7 @@ class VIPManagerMenuView(FroggeView):
             WarningMsgManagementButton(),
             PostVIPListButton(),
             PostVIPPerksButton(),
+            SyncRolesButton(),
             CloseMessageButton()
         ]
         for btn in button_list:
@@ -106,3 +107,18 @@ class PostVIPPerksButton(FroggeButton):
         await self.view.ctx.post_vip_perks_message(interaction)
         
 ################################################################################
+class SyncRolesButton(FroggeButton):
+    
+    def __init__(self):
+        
+        super().__init__(
+            style=ButtonStyle.secondary,
+            label="Sync VIP Roles",
+            disabled=False,
+            row=1
+        )
+        
+    async def callback(self, interaction: Interaction):
+        await self.view.ctx.sync_roles(interaction)
+        
+################################################################################
@@ -24,6 +24,7 @@ class VerificationManagerMenuView(FroggeView):
             ToggleChangeNameButton(),
             ToggleRequireCaptchaButton(),
             ToggleRequire2FAButton(),
+            ToggleTrustSharedButton(),
             SetVerifiedRoleButton(),
             RemoveVerifiedRoleButton(),
             AddRelationButton(),
@@ -199,3 +200,21 @@ class ToggleChangeNameButton(FroggeButton):
         )
 
 ################################################################################
+class ToggleTrustSharedButton(FroggeButton):
+
+    def __init__(self):
+
+        super().__init__(
+            style=ButtonStyle.primary,
+            label="Toggle Shared Identity",
+            disabled=False,
+            row=0
+        )
+
+    async def callback(self, interaction: Interaction):
+        await self.view.ctx.toggle_trust_shared(interaction)
+        await self.view.edit_message_helper(
+            interaction, embed=await self.view.ctx.status(), view=self.view
+        )
+
+################################################################################
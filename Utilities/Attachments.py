@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+from typing import BinaryIO, Union
+
+from discord import File
+
+from logger import log
+################################################################################
+
+__all__ = ("Attachments", )
+
+################################################################################
+class Attachments:
+    """Builds :class:`discord.File` attachments from in-memory buffers."""
+
+################################################################################
+    @staticmethod
+    def from_buffer(buffer: BinaryIO, filename: str) -> File:
+
+        buffer.seek(0)
+        return File(buffer, filename=filename)
+
+################################################################################
+    @staticmethod
+    def from_bytes(data: bytes, filename: str) -> File:
+
+        return Attachments.from_buffer(io.BytesIO(data), filename)
+
+################################################################################
+    @staticmethod
+    def from_text(text: str, filename: str) -> File:
+
+        return Attachments.from_bytes(text.encode("utf-8"), filename)
+
+################################################################################
+    @staticmethod
+    async def persist(data: Union[str, bytes], path: str) -> bool:
+
+        def _write() -> None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            mode = "w" if isinstance(data, str) else "wb"
+            with open(path, mode, **({"encoding": "utf-8"} if mode == "w" else {})) as file:
+                file.write(data)
+
+        try:
+            await asyncio.to_thread(_write)
+        except OSError as e:
+            log.error(None, f"Error writing to {path}: {e.args}")
+            return False
+
+        log.info(None, f"Wrote attachment to {path}")
+        return True
+
+################################################################################
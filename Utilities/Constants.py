@@ -4,11 +4,35 @@
 MAX_EMBED_LENGTH = 6000
 MAX_SELECT_OPTIONS = 24
 MAX_EMBED_FIELDS = 25
+MAX_CONCURRENT_API_REQUESTS = 4
+MAX_CONCURRENT_DMS = 5
+DM_MAX_ATTEMPTS = 3
+DM_RETRY_BASE_SECONDS = 2
+LOG_EMBEDS_PER_MESSAGE = 10
+LOG_FLUSH_SECONDS = 2
+WEBHOOK_DELIVERY_ENABLED = False  # creates a relay webhook in each log channel
+
+# Lodestone
+LODESTONE_MAX_CONNECTIONS = 8
+LODESTONE_TIMEOUT_SECONDS = 15
+LODESTONE_SEARCH_TTL_SECONDS = 6 * 60 * 60
+LODESTONE_PROFILE_TTL_SECONDS = 10 * 60
+LODESTONE_CACHE_SIZE = 2048
+LODESTONE_CACHE_DIR = None  # eg. "Cache/" to keep lookups across restarts
+
+# Verification
+MAX_CONCURRENT_VERIFICATIONS = 8
+MAX_CONCURRENT_VERIFICATIONS_PER_GUILD = 3
+VERIFICATION_QUEUE_LIMIT = 100  # Per guild
+REVALIDATE_SHARED_IDENTITIES = False
+IDENTITY_REVALIDATE_INTERVAL_SECONDS = 24 * 60 * 60  # Per user
+CAPTCHA_POOL_SIZE = 10
 
 # VIPs
 DEFAULT_VIP_WARNING_DAYS = 3
 MAX_VIP_WARNING_DAYS = 7
 DEFAULT_VIP_MEMBERSHIP_LENGTH_DAYS = 30
+VIP_ROLE_SYNC_CONCURRENCY = 5
 
 # Scheduling
 DEFAULT_SCHEDULE_LOCK_MINUTES = 0
@@ -19,6 +43,10 @@ DEFAULT_SCHEDULE_NOTIFY_MINUTES = 180
 MAX_CONCURRENT_EVENTS = 10  # TODO: Implement this
 MAX_SHIFT_BRACKET_COUNT = 5
 MAX_SECONDARY_ELEMENT_COUNT = 20
+EVENT_POST_REFRESH_SECONDS = 3
+EVENT_ARCHIVE_DELAY_HOURS = 8
+EVENT_ARCHIVE_DIR = "EventArchive/"  # None keeps archived events in memory instead
+STAFF_HISTORY_DISPLAY_COUNT = 5
 
 # Staffing
 MAX_CHARACTERS_PER_STAFF = 10
@@ -35,6 +63,12 @@ MAX_ACTIVITY_ENTRIES = 50
 MAX_CONTEST_JUDGES = 10
 MAX_CONTEST_CRITERIA = 20
 MAX_CONTEST_ATTACHMENTS = 5
+ACTIVITY_POST_REFRESH_SECONDS = 1
+ACTIVITY_POST_MIN_INTERVAL_SECONDS = 5
+ENTRIES_REPORT_BATCH_SIZE = 50
+GIVEAWAY_ENTRY_FLUSH_SECONDS = 2
+GIVEAWAY_ENTRY_MAX_ATTEMPTS = 5
+GIVEAWAY_AUTO_ROLL_GRACE_HOURS = 24
 
 # Time Clock
 DEFAULT_CLOCK_THRESHOLD_MINUTES = 15
@@ -1,3 +1,4 @@
+from .Attachments import Attachments
 from .Colors import *
 from .ErrorMessage import ErrorMessage
 from .Utilities import Utilities